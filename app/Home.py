@@ -1,9 +1,8 @@
 ﻿import streamlit as st
-import pandas as pd
 from pathlib import Path
 import datetime
 
-from app._bootstrap import load_cfg
+from app._bootstrap import load_cfg, open_journal
 
 # ----------------------------------
 # Page config
@@ -24,6 +23,13 @@ parsed_dir = APP_ROOT / cfg["data"]["parsed_dir"]
 raw_dir.mkdir(parents=True, exist_ok=True)
 parsed_dir.mkdir(parents=True, exist_ok=True)
 
+# Journal answers "what is there / what is parsed" without reading CSVs; scan/sync
+# stat each entry and only hash or read files whose size or mtime changed.
+journal = open_journal(cfg, APP_ROOT)
+queued = journal.scan(raw_dir)
+journal.sync_datasets(parsed_dir)
+stats = journal.stats()
+
 # ----------------------------------
 # Sidebar branding
 # ----------------------------------
@@ -44,9 +50,11 @@ st.caption("Privacy-first preparation of UK Form E1 with advanced visuals and dr
 
 # Metrics
 c1, c2, c3 = st.columns(3)
-c1.metric("Raw files",   len(list(raw_dir.glob('*'))))
-c2.metric("Parsed files",len(list(parsed_dir.glob('*.csv'))))
+c1.metric("Raw files",   stats["raw_files"])
+c2.metric("Parsed files",stats["datasets"])
 c3.metric("Time window", "Last 12 months")
+if queued:
+    st.caption(f"⏳ {len(queued)} raw file(s) queued for parsing – see **Upload & Parse**.")
 
 # Quick links
 st.divider()
@@ -61,9 +69,10 @@ st.page_link("pages/6_Settings.py", label="⚙️ Settings")
 # Recent parsed preview
 st.divider()
 st.subheader("Recent Parsed Preview")
-parsed_csvs = sorted(parsed_dir.glob("*.csv"), reverse=True)
-if parsed_csvs:
-    df = pd.read_csv(parsed_csvs[0]).head(20)
+latest = journal.latest_preview()
+if latest:
+    path, df = latest
+    st.caption(Path(path).name)
     st.dataframe(df, use_container_width=True)
 else:
     st.info("No parsed files yet. Use **Upload & Parse** to add statements.")
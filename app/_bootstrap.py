@@ -1,6 +1,12 @@
 ﻿from pathlib import Path
+import threading
 import tomllib
 
+_prewarm_lock = threading.Lock()
+_prewarm_thread = None
+_journals_lock = threading.Lock()
+_journals: dict = {}
+
 def get_project_root(start: Path | None = None) -> Path:
     """Walk upward until we find config/app.toml; fall back to project root."""
     p = (start or Path(__file__)).resolve()
@@ -11,7 +17,36 @@ def get_project_root(start: Path | None = None) -> Path:
     return Path(__file__).resolve().parents[2]
 
 def load_cfg():
+    """Read config/app.toml. Every page calls this first, so it also kicks off the one-time prewarm."""
     root = get_project_root(Path(__file__).parent)
     with open(root / "config" / "app.toml", "rb") as f:
         cfg = tomllib.load(f)
+    start_prewarm(cfg)
     return cfg, root
+
+def start_prewarm(cfg: dict):
+    """
+    Once per server process: import heavy modules and warm the chart renderer in
+    a background thread (core/perf/imports.py), so the page the user opens next
+    does not pay for them. Disable with `prewarm = false` under [features].
+    """
+    global _prewarm_thread
+    if not cfg.get("features", {}).get("prewarm", True):
+        return None
+    with _prewarm_lock:
+        if _prewarm_thread is None:
+            from core.perf.imports import prewarm
+            _prewarm_thread = prewarm()
+    return _prewarm_thread
+
+def open_journal(cfg: dict, root: Path):
+    """
+    Ingest journal (SQLite), one instance per server process so listeners
+    registered by one page (e.g. the Settings vendor index) see ingests from others.
+    """
+    from core.ingest.journal import IngestJournal
+    path = root / cfg["data"].get("journal", "data/ingest_journal.sqlite")
+    with _journals_lock:
+        if path not in _journals:
+            _journals[path] = IngestJournal(path)
+        return _journals[path]
@@ -1,16 +1,21 @@
-﻿import streamlit as st
+﻿import threading
+import streamlit as st
 import pandas as pd
 import plotly.express as px
 from pathlib import Path
 
 from app._bootstrap import load_cfg
 from core.export.charts import save_plotly_figure
+from core.dedup.transactions import TransactionDeduper
+from core.convert.money import to_pence, to_display, format_gbp
+from core.spending.calculators import monthly_by_category, category_totals
+from core.spending.recurring import RecurringDetector
 
 # Optional: simple keyword rules if available
 try:
-    from core.classify.rules import load_categories, classify_vendor
+    from core.classify.rules import load_categories, classify_vendor, load_form_e1_mapping
 except Exception:
-    load_categories = classify_vendor = None
+    load_categories = classify_vendor = load_form_e1_mapping = None
 
 st.set_page_config(page_title="Spending Analysis", page_icon="📊", layout="wide")
 
@@ -18,6 +23,7 @@ cfg, APP_ROOT = load_cfg()
 parsed_dir = APP_ROOT / cfg["data"]["parsed_dir"]
 charts_dir = APP_ROOT / cfg["artifacts"]["charts_dir"]
 exports_dir = APP_ROOT / cfg["artifacts"]["exports_dir"]
+cats_path = APP_ROOT / "config" / "categories.yml"
 charts_dir.mkdir(parents=True, exist_ok=True)
 exports_dir.mkdir(parents=True, exist_ok=True)
 
@@ -58,7 +64,7 @@ def normalize(df: pd.DataFrame) -> pd.DataFrame:
             if not c_amt:
                 raise ValueError("No amount column found.")
             amt = pd.to_numeric(df[c_amt], errors="coerce")
-    df["amount"] = amt.fillna(0.0)
+    df["amount_p"] = to_pence(amt)  # int64 pence from here on
 
     # --- vendor / description ---
     c_desc = pick_col(df, DESC_CANDIDATES)
@@ -72,15 +78,18 @@ def normalize(df: pd.DataFrame) -> pd.DataFrame:
         # Try rules if available
         try:
             if load_categories and classify_vendor:
-                cats_path = APP_ROOT / "config" / "categories.yml"
                 if cats_path.exists():
                     cats = load_categories(cats_path)
                     df["category"] = df["vendor"].astype(str).apply(lambda v: classify_vendor(v, cats, default="Uncategorized"))
         except Exception:
             pass
 
+    # --- account (used to block duplicates across statements) ---
+    c_acct = pick_col(df, ["account","Account","Account Name","Account Number"])
+    df["account"] = df[c_acct].astype(str) if c_acct else "Unknown"
+
     # final tidy
-    keep = ["date","vendor","description","amount","category"]
+    keep = ["date","vendor","description","amount_p","account","category"]
     return df[keep].sort_values("date").reset_index(drop=True)
 
 # ------------- load a parsed CSV -------------
@@ -120,17 +129,127 @@ if not spending_candidates:
     )
     st.stop()
 
-# Let the user confirm which CSV to use (default = first decent match)
-choice = st.selectbox(
-    "Choose a transactions CSV",
-    options=[p.name for p in spending_candidates],
-    index=0,
+combine = st.checkbox(
+    "Combine all transaction CSVs (merge duplicates across statements)",
+    value=False,
+    help="The same payment can appear in an overlapping PDF, a CSV export and a screenshot. "
+         "Duplicates are matched by account, amount, a ±3 day window and vendor similarity.",
 )
-chosen_path = next(p for p in spending_candidates if p.name == choice)
 
-raw = pd.read_csv(chosen_path)
-try:
-    df = normalize(raw)
-except Exception as e:
-    st.error(f"Could not normalize `{chosen_path.name}`: {e}")
+# ------------- combined view: one deduper + recurring detector per server, fed only new/changed files -------------
+@st.cache_resource
+def _combined() -> dict:
+    return {"lock": threading.Lock(), "dedup": TransactionDeduper(window_days=3), "recurring": RecurringDetector(),
+            "files": {}, "rules": None}
+
+def rules_mtime() -> int | None:
+    """categories.yml version: rows are classified in normalize(), so cached results depend on it."""
+    return cats_path.stat().st_mtime_ns if cats_path.exists() else None
+
+def combined_transactions(paths: list[Path]) -> tuple[TransactionDeduper, RecurringDetector]:
+    """
+    Add CSVs not seen yet (by name, mtime and size) to the shared deduper, and the rows
+    it keeps to the recurring detector (which re-checks only the vendors they touch).
+    A file that changed or disappeared cannot be taken back out, and categories are
+    fixed when a file is added, so either case (or a rules edit) rebuilds.
+    """
+    state = _combined()
+    with state["lock"]:
+        stamps = {p.name: (p.stat().st_mtime_ns, p.stat().st_size) for p in paths}
+        rules = rules_mtime()
+        seen = state["files"]
+        if state["rules"] != rules or any(stamps.get(name) != stamp for name, stamp in seen.items()):
+            state.update(dedup=TransactionDeduper(window_days=3), recurring=RecurringDetector(), files={}, rules=rules)
+            seen = state["files"]
+        for p in paths:
+            if p.name in seen:
+                continue
+            try:
+                kept = state["dedup"].add(normalize(pd.read_csv(p)), source=p.name)
+                if not kept.empty:
+                    state["recurring"].add(kept)
+            except Exception as e:
+                st.warning(f"Skipped `{p.name}`: {e}")
+            seen[p.name] = stamps[p.name]
+        return state["dedup"], state["recurring"]
+
+@st.cache_resource(max_entries=8)
+def file_recurring(name: str, mtime_ns: int, rules_mtime_ns: int | None, _df: pd.DataFrame) -> RecurringDetector:
+    """Recurring detector for one CSV and categories.yml version; reruns and other sessions reuse it."""
+    det = RecurringDetector()
+    det.add(_df)
+    return det
+
+if combine:
+    dedup, detector = combined_transactions(spending_candidates)
+    df = dedup.transactions()
+    if df.empty:
+        st.error("No usable transactions found in the CSVs.")
+        st.stop()
+    df = df[["date","vendor","description","amount_p","account","category","source"]]
+    st.caption(f"{len(df)} transactions from {len(spending_candidates)} file(s); {len(dedup.report)} duplicate(s) merged.")
+    if not dedup.report.empty:
+        with st.expander(f"Merged duplicates ({len(dedup.report)})"):
+            st.dataframe(to_display(dedup.report), use_container_width=True)
+else:
+    # Let the user confirm which CSV to use (default = first decent match)
+    choice = st.selectbox(
+        "Choose a transactions CSV",
+        options=[p.name for p in spending_candidates],
+        index=0,
+    )
+    chosen_path = next(p for p in spending_candidates if p.name == choice)
+    raw = pd.read_csv(chosen_path)
+    try:
+        df = normalize(raw)
+    except Exception as e:
+        st.error(f"Could not normalize `{chosen_path.name}`: {e}")
+        st.stop()
+    detector = file_recurring(chosen_path.name, chosen_path.stat().st_mtime_ns, rules_mtime(), df)
+
+# ------------- monthly outgoings by category -------------
+st.divider()
+st.subheader("Monthly outgoings by category (GBP)")
+monthly = monthly_by_category(df)
+if monthly.empty:
+    st.info("No outgoings (negative amounts) in this file.")
     st.stop()
+monthly_view = to_display(monthly)
+fig = px.bar(monthly_view, x="month", y="spend", color="category", barmode="stack")
+st.plotly_chart(fig, use_container_width=True)
+
+# category -> Form E1 section (config/mapping_form_e1.yml), shared by totals and regular outgoings
+mapping_path = APP_ROOT / "config" / "mapping_form_e1.yml"
+e1_mapping = load_form_e1_mapping(mapping_path) if load_form_e1_mapping and mapping_path.exists() else None
+totals = to_display(category_totals(df, mapping=e1_mapping))
+st.dataframe(totals, use_container_width=True)
+
+col_a, col_b = st.columns(2)
+with col_a:
+    if st.button("Export category chart (PNG/PDF)"):
+        base = charts_dir / "spending_monthly_by_category"
+        try:
+            save_plotly_figure(fig, base)
+            st.success(f"Saved {base.with_suffix('.png').name} / {base.with_suffix('.pdf').name}")
+        except Exception as e:
+            st.info(f"Image export needs 'kaleido'. Try: pip install kaleido. ({e})")
+with col_b:
+    st.download_button("Download monthly CSV", data=monthly_view.to_csv(index=False), file_name="spending_monthly_by_category.csv")
+
+# ------------- regular outgoings (Form E1) -------------
+st.divider()
+st.subheader("Regular outgoings (weekly / monthly / quarterly / annual)")
+recurring = detector.series.copy()
+if recurring.empty:
+    st.info("No recurring payments detected yet (needs at least 3 regular payments, or 2 for annual).")
+else:
+    if e1_mapping is not None:
+        recurring["section"] = recurring["category"].map(e1_mapping).fillna("Section 3 – Other")
+    n_flagged = int((recurring["status"] != "active").sum())
+    c1, c2, c3 = st.columns(3)
+    c1.metric("Recurring payments", len(recurring))
+    c2.metric("Monthly equivalent", format_gbp(int(recurring.loc[recurring["status"] != "missed", "monthly_p"].sum())))
+    c3.metric("Missed / changed", n_flagged)
+    recurring_view = to_display(recurring)
+    st.dataframe(recurring_view, use_container_width=True)
+    st.download_button("Download regular outgoings CSV", data=recurring_view.to_csv(index=False), file_name="spending_regular_outgoings.csv")
@@ -6,6 +6,7 @@ import plotly.graph_objects as go
 from app._bootstrap import load_cfg
 from core.income.calculators import weekly_to_monthly, rolling_12m_totals, build_waterfall_row
 from core.export.charts import save_plotly_figure
+from core.convert.money import to_display, totals_to_display
 
 st.set_page_config(page_title="Employment Income (Parasol)", page_icon="💼", layout="wide")
 
@@ -15,6 +16,7 @@ parsed_dir  = (APP_ROOT / cfg["data"]["parsed_dir"]).resolve()
 charts_dir  = (APP_ROOT / cfg["artifacts"]["charts_dir"]).resolve()
 exports_dir = (APP_ROOT / cfg["artifacts"]["exports_dir"]).resolve()
 for p in (parsed_dir, charts_dir, exports_dir): p.mkdir(parents=True, exist_ok=True)
+sample = cfg.get("sample", {})
 
 st.title("💼 Employment Income (Parasol)")
 st.caption("Demo-safe page: generates synthetic weekly payslips if none found. Parser for real PDFs will be added next.")
@@ -28,24 +30,9 @@ REQUIRED_COLS = [
 ]
 
 def generate_demo_payslips() -> pd.DataFrame:
-    import numpy as np
-    rng = pd.date_range(pd.Timestamp.today().normalize() - pd.DateOffset(years=1), periods=52, freq="W-FRI")
-    rows = []
-    g = np.random.default_rng(17)
-    for d in rng:
-        gross = float(max(900, g.normal(1200, 80)))
-        paye  = round(gross * 0.18, 2)
-        ee_ni = round(gross * 0.09, 2)
-        er_ni = round(gross * 0.11, 2)
-        pens_ee = round(gross * 0.03, 2)
-        pens_er = round(gross * 0.03, 2)
-        holiday = 0.00  # set >0 if rolled-up
-        other = float(max(0, g.normal(8, 6)))
-        student = 0.0
-        net = round(gross - (paye + ee_ni + pens_ee + other + student) + holiday, 2)
-        rows.append([d.date(), gross, paye, ee_ni, er_ni, pens_ee, pens_er, holiday, other, student, net])
-    df = pd.DataFrame(rows, columns=REQUIRED_COLS)
-    return df
+    from core.synthetic.generators import default_span, generate_payslips
+    start, end = default_span(sample.get("years", 1))
+    return generate_payslips(start, end, seed=sample.get("seed", 42) + 1)
 
 def coerce_income(df: pd.DataFrame) -> pd.DataFrame:
     """Make sure required columns exist and types are correct; never crash."""
@@ -77,10 +64,12 @@ def load_income_df() -> tuple[pd.DataFrame, str]:
         except Exception as e:
             st.warning(f"Could not load {candidates[0].name} ({e}). Falling back to demo data.")
     # Fallback: demo
+    if not cfg["features"].get("sample_dataset", False):
+        return pd.DataFrame(columns=REQUIRED_COLS), "No payslip CSV found (sample data disabled)."
     demo = generate_demo_payslips()
     out = parsed_dir / "demo_parasol_income.csv"
     demo.to_csv(out, index=False)
-    return demo, "Generated demo payslips (52 weeks)"
+    return demo, f"Generated demo payslips ({len(demo)} weeks)"
 
 # ---------------------------
 # UI – Upload area (placeholder)
@@ -135,11 +124,11 @@ with colA:
 st.divider()
 st.subheader("Monthly and 12-month totals")
 
-monthly = weekly_to_monthly(df)
+monthly = to_display(weekly_to_monthly(df))
 st.dataframe(monthly, use_container_width=True)
 
 tot = rolling_12m_totals(df)
-tot_df = pd.DataFrame([tot])
+tot_df = pd.DataFrame([totals_to_display(tot)])
 st.write("**Rolling 12-month totals**")
 st.dataframe(tot_df, use_container_width=True)
 
@@ -7,6 +7,7 @@ import plotly.graph_objects as go
 from app._bootstrap import load_cfg
 from core.property.calculators import coerce_airbnb, monthly_summary, occupancy_heatmap
 from core.export.charts import save_plotly_figure
+from core.convert.money import to_display
 
 st.set_page_config(page_title="Property & Airbnb", page_icon="🏠", layout="wide")
 
@@ -15,6 +16,7 @@ parsed_dir  = (APP_ROOT / cfg["data"]["parsed_dir"]).resolve()
 charts_dir  = (APP_ROOT / cfg["artifacts"]["charts_dir"]).resolve()
 exports_dir = (APP_ROOT / cfg["artifacts"]["exports_dir"]).resolve()
 for p in (parsed_dir, charts_dir, exports_dir): p.mkdir(parents=True, exist_ok=True)
+sample = cfg.get("sample", {})
 
 st.title("🏠 Property & Airbnb")
 st.caption("EUR incomes/outgoings converted to GBP at statement rate. Shows monthly net and occupancy. Parser for PDFs comes next.")
@@ -25,26 +27,9 @@ REQUIRED_COLS = [
 ]
 
 def generate_demo_airbnb() -> pd.DataFrame:
-    # one year of daily rows with stochastic bookings
-    import numpy as np
-    rng = pd.date_range(pd.Timestamp.today().normalize() - pd.DateOffset(years=1) + pd.offsets.Day(1),
-                        periods=365, freq="D")
-    g = np.random.default_rng(9)
-    rows = []
-    for d in rng:
-        booked = g.random() < 0.45  # ~45% occupancy
-        nights = 1 if booked else 0
-        adr_eur = g.normal(120, 25) if booked else 0
-        income = max(0, adr_eur * nights)
-        cleaning = 30 if booked and (g.random() < 0.6) else 0
-        fees = income * 0.14 if booked else 0
-        taxes = income * 0.03 if booked else 0
-        other = 0
-        # random but stable-ish statement rate (EUR→GBP inverse)
-        rate = round(g.normal(0.85, 0.02), 4)  # EUR * (1/rate) = GBP  (we divide later)
-        rows.append([d.date(), nights, "EUR", rate, round(income,2), cleaning, round(fees,2), round(taxes,2), other])
-    df = pd.DataFrame(rows, columns=REQUIRED_COLS)
-    return df
+    from core.synthetic.generators import default_span, generate_airbnb
+    start, end = default_span(sample.get("years", 1))
+    return generate_airbnb(start, end, listings=sample.get("listings", 1), seed=sample.get("seed", 42) + 2)
 
 def load_airbnb_df() -> tuple[pd.DataFrame, str]:
     # Look for CSV created earlier; otherwise generate demo
@@ -60,10 +45,12 @@ def load_airbnb_df() -> tuple[pd.DataFrame, str]:
             return df, f"Loaded {candidates[0].name}"
         except Exception as e:
             st.warning(f"Could not load {candidates[0].name} ({e}). Falling back to demo data.")
+    if not cfg["features"].get("sample_dataset", False):
+        return pd.DataFrame(columns=REQUIRED_COLS), "No Airbnb CSV found (sample data disabled)."
     demo = generate_demo_airbnb()
     out = parsed_dir / "demo_airbnb.csv"
     demo.to_csv(out, index=False)
-    return demo, "Generated demo Airbnb dataset (365 days)"
+    return demo, f"Generated demo Airbnb dataset ({demo['date'].nunique()} days, {demo['listing'].nunique()} listing(s))"
 
 # Upload placeholder (parser to come)
 with st.expander("Upload Airbnb PDF statements – parser coming soon", expanded=False):
@@ -77,7 +64,7 @@ st.success(status)
 # Monthly summary chart
 st.divider()
 st.subheader("Monthly income vs outgoings vs net (GBP)")
-monthly = monthly_summary(df)
+monthly = to_display(monthly_summary(df))
 fig = go.Figure()
 fig.add_bar(name="Income (GBP)", x=monthly["month"], y=monthly["income_gbp"])
 fig.add_bar(name="Fees (GBP)",   x=monthly["month"], y=monthly["fees_gbp"])
@@ -130,7 +117,7 @@ with st.expander("Download XLSX (monthly + raw)"):
         buf = io.BytesIO()
         with pd.ExcelWriter(buf, engine="openpyxl") as xw:
             monthly.to_excel(xw, index=False, sheet_name="Monthly")
-            coerce_airbnb(df).to_excel(xw, index=False, sheet_name="Raw")
+            to_display(coerce_airbnb(df)).to_excel(xw, index=False, sheet_name="Raw")
         st.download_button("Download XLSX", data=buf.getvalue(), file_name="airbnb_summary.xlsx")
     except Exception as e:
         st.info(f"Could not create XLSX. Use CSV instead. ({e})")
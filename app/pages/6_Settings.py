@@ -1,4 +1,119 @@
+import threading
+from pathlib import Path
+
 import streamlit as st
+import pandas as pd
+
+from app._bootstrap import load_cfg, open_journal, start_prewarm
+from core.classify.rules import load_categories, save_categories
+from core.classify.vendor_index import VendorIndex
+from core.convert.money import to_display, format_gbp
+
 st.set_page_config(page_title="Settings", page_icon="⚙️", layout="wide")
 st.title("⚙️ Settings")
-st.info("Category editor and persistent overrides will appear here.")
+
+cfg, APP_ROOT = load_cfg()
+parsed_dir = APP_ROOT / cfg["data"]["parsed_dir"]
+cats_path = APP_ROOT / "config" / "categories.yml"
+
+warm = start_prewarm(cfg)
+if warm is not None:
+    with st.expander("Startup prewarm"):
+        st.caption("Background imports at server start (seconds; blank = not installed).")
+        snap = dict(warm.timings)  # one copy: the prewarm thread may still be adding entries
+        if warm.is_alive():
+            st.caption("Still running; showing the modules loaded so far.")
+        st.dataframe(pd.DataFrame({"module": list(snap), "seconds": list(snap.values())}),
+                     use_container_width=True)
+
+if not cfg.get("features", {}).get("rule_tuner", False):
+    st.info("Category editor and persistent overrides will appear here.")
+    st.stop()
+
+# ---------------- vendor index (kept across reruns, fed by the ingest journal) ----------------
+journal = open_journal(cfg, APP_ROOT)
+
+def _index_frame(df: pd.DataFrame) -> bool:
+    return "vendor" in df.columns and bool({"amount", "amount_p"} & set(df.columns))
+
+@st.cache_resource
+def _vendor_index() -> dict:
+    """
+    One VendorIndex per server process. The journal calls `on_dataset` from
+    whichever page records or removes a dataset; the lock serialises that with
+    the rebuild and the reads below.
+    """
+    state = {"lock": threading.Lock(), "index": VendorIndex(), "files": set(), "stale": True}
+
+    def on_dataset(path: str, df: pd.DataFrame | None) -> None:
+        with state["lock"]:
+            if df is None or path in state["files"]:
+                state["stale"] = True  # removed or overwritten: its counts can't be subtracted
+            elif not state["stale"] and _index_frame(df):
+                state["index"].add(df)
+                state["files"].add(path)
+
+    journal.add_listener(on_dataset)
+    return state
+
+def refresh_index() -> dict:
+    """Pick up CSVs written outside ingest, and rebuild from the journal after a removal."""
+    state = _vendor_index()
+    journal.sync_datasets(parsed_dir)
+    with state["lock"]:
+        if state["stale"]:
+            idx, files = VendorIndex(), set()
+            for path in journal.datasets():
+                try:
+                    head = pd.read_csv(path, nrows=0)
+                    if _index_frame(head):
+                        idx.add(pd.read_csv(path))
+                        files.add(path)
+                except Exception as e:
+                    st.warning(f"Skipped `{Path(path).name}`: {e}")
+            state.update(index=idx, files=files, stale=False)
+    return state
+
+state = refresh_index()
+idx = state["index"]
+categories = load_categories(cats_path) if cats_path.exists() else {}
+
+st.subheader("Rule tuner")
+st.caption(f"{len(idx):,} distinct vendors indexed from `{parsed_dir.name}`.")
+if not len(idx):
+    st.info("No transaction CSVs with a `vendor` column yet. Use **Upload & Parse** first.")
+    st.stop()
+
+# ---------------- keyword preview ----------------
+c1, c2 = st.columns([2, 1])
+keyword = c1.text_input("Candidate keyword (case-insensitive substring, as in categories.yml)")
+target = c2.selectbox("Category", options=list(categories) or ["Misc"])
+
+if keyword:
+    with state["lock"]:
+        s, matches = idx.summary(keyword), idx.lookup(keyword).head(200)
+    m1, m2, m3 = st.columns(3)
+    m1.metric("Vendors matched", f"{s['vendors']:,}")
+    m2.metric("Transactions", f"{s['count']:,}")
+    m3.metric("Spend", format_gbp(s["spend_p"]))
+    st.dataframe(to_display(matches), use_container_width=True)
+    if st.button(f"Add “{keyword.upper()}” to {target}"):
+        rule = categories.get(target) or {}
+        include = rule.get("include") or []  # `include:` left empty in the YAML loads as None
+        if keyword.upper() not in include:
+            categories[target] = {**rule, "include": [*include, keyword.upper()]}
+            save_categories(cats_path, categories)
+            st.success(f"Saved to {cats_path.name} (its header comment is kept; comments inside the rules are not).")
+        else:
+            st.info("Keyword already present.")
+
+# ---------------- suggestions for the Uncategorized bucket ----------------
+st.divider()
+st.subheader("Suggested keywords for Uncategorized vendors")
+st.caption("Ranked by the spend they would cover; `other_vendors` = vendors already in another category the keyword would also hit.")
+with state["lock"]:
+    sugg = idx.suggest_keywords(categories, top=25)
+if sugg.empty:
+    st.success("Every indexed vendor matches a category rule.")
+else:
+    st.dataframe(to_display(sugg), use_container_width=True)
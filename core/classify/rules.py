@@ -1,15 +1,44 @@
 import re
-import yaml
 from pathlib import Path
 
+def _read_yaml(path: Path):
+    import yaml  # deferred: only pages that read rules pay for it
+    return yaml.safe_load(path.read_text(encoding="utf-8"))
+
 def load_categories(path: Path) -> dict:
-    data = yaml.safe_load(path.read_text(encoding="utf-8"))
+    data = _read_yaml(path)
     return data.get("categories", {})
 
 def classify_vendor(vendor: str, categories: dict, default: str="Misc") -> str:
     v = vendor.upper()
     for cat, cfg in categories.items():
-        for kw in cfg.get("include", []):
+        for kw in (cfg or {}).get("include") or []:
             if re.search(re.escape(kw.upper()), v):
                 return cat
     return default
+
+def load_form_e1_mapping(path: Path) -> dict:
+    """category -> Form E1 section label (config/mapping_form_e1.yml)."""
+    data = _read_yaml(path)
+    return data.get("map", {})
+
+def _header(text: str) -> str:
+    """Leading comment/blank lines of a YAML file."""
+    lines = []
+    for line in text.splitlines(keepends=True):
+        if line.strip() and not line.lstrip().startswith("#"):
+            break
+        lines.append(line)
+    return "".join(lines)
+
+def save_categories(path: Path, categories: dict) -> None:
+    """
+    Write categories back to YAML. The header comment is kept; comments further
+    down (inside the mapping) are not.
+    """
+    import yaml
+    text = path.read_text(encoding="utf-8") if path.exists() else ""
+    data = yaml.safe_load(text) or {}
+    data["categories"] = categories
+    body = yaml.safe_dump(data, sort_keys=False, allow_unicode=True)
+    path.write_text(_header(text) + body, encoding="utf-8")
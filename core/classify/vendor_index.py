@@ -0,0 +1,139 @@
+from __future__ import annotations
+from collections import defaultdict
+import numpy as np
+import pandas as pd
+
+from core.convert.money import to_pence
+from core.dedup.transactions import normalize_text
+
+# Tokens that never make useful category keywords on their own.
+STOPWORDS = {
+    "THE", "AND", "LTD", "LIMITED", "PLC", "UK", "GB", "COM", "CO", "WWW", "HTTP", "HTTPS",
+    "PAYMENT", "CARD", "DEBIT", "CREDIT", "POS", "DD", "SO", "FPS", "REF", "TO", "FROM", "ON", "AT",
+}
+
+class VendorIndex:
+    """
+    Inverted n-gram index over distinct vendor strings with per-vendor stats.
+
+    Keyword lookups follow `classify_vendor` semantics (case-insensitive
+    substring): candidates come from intersecting the keyword's n-gram posting
+    lists and are then verified, so a lookup touches only vendors sharing all
+    n-grams with the keyword. `add()` is incremental — only unseen vendors are
+    tokenised — so the index can be kept alive across reruns and fed on ingest.
+    """
+
+    def __init__(self, n: int = 3):
+        self.n = n
+        self.vendors: list[str] = []          # upper-cased, id = position
+        self._ids: dict[str, int] = {}
+        self._postings: dict[str, list[int]] = defaultdict(list)
+        self._frozen: dict[str, np.ndarray] = {}
+        self.count = np.zeros(0, dtype="int64")
+        self.spend_p = np.zeros(0, dtype="int64")
+
+    def __len__(self) -> int:
+        return len(self.vendors)
+
+    def _grams(self, v: str) -> set[str]:
+        return {v[i:i + self.n] for i in range(len(v) - self.n + 1)}
+
+    def add(self, df: pd.DataFrame) -> int:
+        """Add transactions (vendor + amount or amount_p). Returns the number of new vendors."""
+        amount_p = df["amount_p"] if "amount_p" in df.columns else to_pence(df["amount"])
+        g = (
+            pd.DataFrame({"vendor": df["vendor"].astype(object).fillna("").astype(str).str.upper(), "spend_p": (-amount_p).clip(lower=0)})
+            .groupby("vendor", sort=False)["spend_p"].agg(["size", "sum"])
+        )
+        new = [v for v in g.index if v not in self._ids]
+        start = len(self.vendors)
+        for i, v in enumerate(new, start):
+            self._ids[v] = i
+            self.vendors.append(v)
+            for gram in self._grams(v):
+                self._postings[gram].append(i)
+                self._frozen.pop(gram, None)
+        if new:
+            self.count = np.concatenate([self.count, np.zeros(len(new), dtype="int64")])
+            self.spend_p = np.concatenate([self.spend_p, np.zeros(len(new), dtype="int64")])
+        ids = np.fromiter((self._ids[v] for v in g.index), dtype="int64", count=len(g))
+        np.add.at(self.count, ids, g["size"].to_numpy(dtype="int64"))
+        np.add.at(self.spend_p, ids, g["sum"].to_numpy(dtype="int64"))
+        return len(new)
+
+    def _posting(self, gram: str) -> np.ndarray:
+        arr = self._frozen.get(gram)
+        if arr is None:
+            arr = self._frozen[gram] = np.asarray(self._postings.get(gram, ()), dtype="int64")
+        return arr
+
+    def match(self, keyword: str) -> np.ndarray:
+        """Ids of vendors containing `keyword` (case-insensitive), like classify_vendor."""
+        kw = keyword.upper()
+        if not kw:
+            return np.zeros(0, dtype="int64")
+        if len(kw) < self.n:
+            # Too short for the index: vectorised scan over distinct vendors.
+            hits = pd.Series(self.vendors, dtype=object).str.contains(kw, regex=False).to_numpy(dtype=bool)
+            return np.flatnonzero(hits)
+        lists = sorted((self._posting(g) for g in self._grams(kw)), key=len)
+        cand = lists[0]
+        for arr in lists[1:]:
+            if not len(cand):
+                break
+            cand = np.intersect1d(cand, arr, assume_unique=True)
+        return np.array([i for i in cand if kw in self.vendors[i]], dtype="int64")
+
+    def lookup(self, keyword: str) -> pd.DataFrame:
+        """Matching vendors with transaction count and spend (pence), biggest spend first."""
+        ids = self.match(keyword)
+        out = pd.DataFrame({
+            "vendor": [self.vendors[i] for i in ids],
+            "count": self.count[ids],
+            "spend_p": self.spend_p[ids],
+        })
+        return out.sort_values("spend_p", ascending=False).reset_index(drop=True)
+
+    def summary(self, keyword: str) -> dict:
+        ids = self.match(keyword)
+        return {"vendors": int(len(ids)), "count": int(self.count[ids].sum()), "spend_p": int(self.spend_p[ids].sum())}
+
+    def classify(self, categories: dict, default: str = "Uncategorized") -> np.ndarray:
+        """Category per vendor id, same first-match-wins order as classify_vendor, via the index."""
+        out = np.full(len(self.vendors), default, dtype=object)
+        done = np.zeros(len(self.vendors), dtype=bool)
+        for cat, cfg in categories.items():
+            for kw in (cfg or {}).get("include") or []:
+                ids = self.match(kw)
+                ids = ids[~done[ids]]
+                out[ids] = cat
+                done[ids] = True
+        return out
+
+    def suggest_keywords(self, categories: dict, target: str = "Uncategorized", top: int = 20, min_len: int = 3) -> pd.DataFrame:
+        """
+        Rank candidate keywords (vendor tokens) by the spend they would cover in
+        `target` (default: vendors no rule matches). `other_vendors` counts vendors
+        already in another category that the keyword would also hit.
+        """
+        cats = self.classify(categories)
+        ids = np.flatnonzero(cats == target)
+        if not len(ids):
+            return pd.DataFrame(columns=["keyword", "vendors", "count", "spend_p", "other_vendors"])
+        names = pd.Series([self.vendors[i] for i in ids])
+        toks = pd.DataFrame({
+            "keyword": normalize_text(names).str.split(" "),
+            "id": ids,
+        }).explode("keyword")
+        toks = toks[(toks["keyword"].str.len() >= min_len) & ~toks["keyword"].isin(STOPWORDS)].drop_duplicates()
+        toks["count"] = self.count[toks["id"].to_numpy(dtype="int64")]
+        toks["spend_p"] = self.spend_p[toks["id"].to_numpy(dtype="int64")]
+        cand = (
+            toks.groupby("keyword", as_index=False)
+            .agg(vendors=("id", "size"), count=("count", "sum"), spend_p=("spend_p", "sum"))
+            .sort_values(["spend_p", "vendors"], ascending=False)
+            .head(top)
+            .reset_index(drop=True)
+        )
+        cand["other_vendors"] = [int((cats[self.match(k)] != target).sum()) for k in cand["keyword"]]
+        return cand
@@ -1 +1,18 @@
-# TODO: Parse EUR->GBP statement rate from Airbnb PDF and apply to lines.
+# TODO: Extract the EUR->GBP statement rate from Airbnb PDFs (core/parsers/airbnb_pdf.py); applying it is eur_to_gbp_pence below.
+from __future__ import annotations
+import numpy as np
+import pandas as pd
+
+from core.convert.money import to_pence
+
+def statement_rate(rate: pd.Series) -> pd.Series:
+    """EUR per GBP as printed on the statement; missing/zero falls back to 1.0."""
+    return pd.to_numeric(rate, errors="coerce").replace(0, np.nan).fillna(1.0)
+
+def eur_to_gbp_pence(amount_eur: pd.Series, rate: pd.Series) -> pd.Series:
+    """
+    Convert EUR amounts to GBP pence at the statement rate (GBP = EUR / rate).
+    This is the only place the FX division happens; the result is rounded once,
+    half to even, and everything downstream stays in integer pence.
+    """
+    return to_pence(pd.to_numeric(amount_eur, errors="coerce").fillna(0.0) / statement_rate(rate))
@@ -0,0 +1,48 @@
+"""
+Money convention: amounts are int64 minor units (pence) with a `_p` column suffix.
+
+Floats are only converted to pence at the boundary (parsed CSVs, FX) with
+banker's rounding (round half to even), summed exactly as integers, and turned
+back into pounds only for display/export via `to_display`.
+"""
+from __future__ import annotations
+import numpy as np
+import pandas as pd
+
+SUFFIX = "_p"
+
+def to_pence(values) -> pd.Series | np.ndarray:
+    """Pounds (float/str/Series) -> int64 pence, round half to even; NaN/invalid -> 0."""
+    if isinstance(values, pd.Series):
+        x = pd.to_numeric(values, errors="coerce").astype("float64").fillna(0.0).to_numpy()
+        return pd.Series(_rint_pence(x), index=values.index)
+    return _rint_pence(np.nan_to_num(np.asarray(values, dtype="float64")))
+
+def _rint_pence(x: np.ndarray) -> np.ndarray:
+    # Snap to 6 dp first so binary noise (1.015*100 = 101.4999…) doesn't decide the tie.
+    return np.rint(np.round(x * 100, 6)).astype("int64")
+
+def from_pence(p):
+    """int64 pence -> float pounds (display only)."""
+    if isinstance(p, pd.Series):
+        return p.astype("float64") / 100
+    return np.asarray(p, dtype="float64") / 100 if np.ndim(p) else int(p) / 100
+
+def format_gbp(p: int) -> str:
+    sign = "-" if p < 0 else ""
+    pounds, pence = divmod(abs(int(p)), 100)
+    return f"{sign}£{pounds:,}.{pence:02d}"
+
+def pence_cols(df: pd.DataFrame) -> list[str]:
+    return [c for c in df.columns if c.endswith(SUFFIX)]
+
+def to_display(df: pd.DataFrame) -> pd.DataFrame:
+    """Replace every `<name>_p` pence column by a `<name>` float pounds column (for charts/tables/exports)."""
+    out = df.copy()
+    for c in pence_cols(out):
+        out[c[: -len(SUFFIX)]] = from_pence(out.pop(c))
+    return out
+
+def totals_to_display(totals: dict) -> dict:
+    """Same as `to_display` for a {name_p: pence} dict."""
+    return {(k[: -len(SUFFIX)] if k.endswith(SUFFIX) else k): (v / 100 if k.endswith(SUFFIX) else v) for k, v in totals.items()}
@@ -0,0 +1 @@
+# dedup package
@@ -0,0 +1,188 @@
+from __future__ import annotations
+from difflib import SequenceMatcher
+import numpy as np
+import pandas as pd
+
+from core.convert.money import to_pence
+
+REPORT_COLS = [
+    "kept_id", "merged_id", "account", "amount_p", "kept_date", "merged_date",
+    "kept_vendor", "merged_vendor", "kept_source", "merged_source", "score",
+]
+
+def normalize_text(s: pd.Series) -> pd.Series:
+    """Upper-case, drop digits/punctuation and collapse whitespace (card refs, dates, etc.)."""
+    # Vendors repeat a lot: clean each distinct string once, then broadcast back.
+    codes, uniques = pd.factorize(s.astype(object).fillna("").astype(str))
+    clean = (
+        pd.Series(uniques).str.upper()
+        .str.replace(r"[^A-Z ]+", " ", regex=True)
+        .str.replace(r"\s+", " ", regex=True)
+        .str.strip()
+    )
+    return pd.Series(clean.to_numpy()[codes], index=s.index)
+
+def text_similarity(a: str, b: str) -> float:
+    if not a or not b:
+        return 0.0
+    if a == b or a in b or b in a:
+        return 1.0
+    return SequenceMatcher(None, a, b).ratio()
+
+def _prepare(df: pd.DataFrame, source: str) -> pd.DataFrame:
+    """Add the blocking keys: account, amount in pence, day number, normalised text."""
+    d = df.copy()
+    if "account" not in d.columns:
+        d["account"] = "Unknown"
+    if "source" not in d.columns:
+        d["source"] = source
+    if "description" not in d.columns:
+        d["description"] = d["vendor"]
+    d["account"] = d["account"].fillna("Unknown").astype(str)
+    d["source"] = d["source"].astype(str)
+    d["date"] = pd.to_datetime(d["date"], errors="coerce")
+    d = d.dropna(subset=["date"])
+    d["_amount_p"] = d["amount_p"] if "amount_p" in d.columns else to_pence(d["amount"])
+    d["_day"] = d["date"].values.astype("datetime64[D]").astype("int64")
+    d["_vendor_n"] = normalize_text(d["vendor"])
+    d["_desc_n"] = normalize_text(d["description"])
+    return d
+
+class TransactionDeduper:
+    """
+    Incremental cross-statement de-duplication.
+
+    Rows are blocked by (account, amount in pence) and sorted by date, so only
+    neighbours inside the same block and within `window_days` are compared
+    (sort = O(n log n)); vendor/description fuzzy matching runs on those
+    candidate pairs only. A row is merged into an earlier one only when they
+    come from different sources — two identical coffees on one statement are
+    both real.
+
+    Call `add()` for each new file/frame; `kept` holds the de-duplicated
+    transactions and `report` lists every merge made so far.
+    """
+
+    def __init__(self, window_days: int = 3, threshold: float = 0.6):
+        self.window_days = window_days
+        self.threshold = threshold
+        self.kept = pd.DataFrame()
+        self.report = pd.DataFrame(columns=REPORT_COLS)
+        self._next_id = 0
+        self._batches = 0
+
+    def add(self, df: pd.DataFrame, source: str | None = None) -> pd.DataFrame:
+        """
+        Merge a new batch of transactions (date, vendor, amount, optional
+        description/account/source). Returns the rows of this batch that were
+        kept (not duplicates). The batch's own merges are appended to `report`.
+        """
+        self._batches += 1
+        new = _prepare(df, source or f"batch-{self._batches}")
+        new["dedup_id"] = np.arange(self._next_id, self._next_id + len(new), dtype="int64")
+        self._next_id += len(new)
+        if new.empty:
+            return new.drop(columns=[c for c in new.columns if c.startswith("_")])
+
+        # Only existing rows that share a block with the batch need to be looked at.
+        if self.kept.empty:
+            old = new.iloc[0:0]
+        else:
+            blocks = pd.MultiIndex.from_frame(new[["account", "_amount_p"]])
+            old_keys = pd.MultiIndex.from_frame(self.kept[["account", "_amount_p"]])
+            old = self.kept[old_keys.isin(blocks)]
+
+        dup_of, scores = self._match(pd.concat([old.assign(_new=False), new.assign(_new=True)], ignore_index=True))
+        is_dup = new["dedup_id"].isin(dup_of.index)
+        kept_new = new[~is_dup]
+
+        if len(dup_of):
+            by_id = pd.concat([self.kept, new], ignore_index=True).set_index("dedup_id")
+            k = by_id.loc[dup_of.values]
+            m = by_id.loc[dup_of.index]
+            rep = pd.DataFrame({
+                "kept_id": dup_of.values,
+                "merged_id": dup_of.index.values,
+                "account": m["account"].values,
+                "amount_p": m["_amount_p"].values,
+                "kept_date": k["date"].values,
+                "merged_date": m["date"].values,
+                "kept_vendor": k["vendor"].values,
+                "merged_vendor": m["vendor"].values,
+                "kept_source": k["source"].values,
+                "merged_source": m["source"].values,
+                "score": scores.reindex(dup_of.index).values.round(3),
+            })
+            self.report = rep if self.report.empty else pd.concat([self.report, rep], ignore_index=True)
+
+        self.kept = kept_new if self.kept.empty else pd.concat([self.kept, kept_new], ignore_index=True)
+        return kept_new.drop(columns=[c for c in kept_new.columns if c.startswith("_")])
+
+    def transactions(self) -> pd.DataFrame:
+        """De-duplicated transactions seen so far, sorted by date."""
+        if self.kept.empty:
+            return self.kept
+        out = self.kept.drop(columns=[c for c in self.kept.columns if c.startswith("_")])
+        return out.sort_values(["date", "dedup_id"]).reset_index(drop=True)
+
+    def _match(self, d: pd.DataFrame) -> tuple[pd.Series, pd.Series]:
+        """Return (merged_id -> kept_id, merged_id -> score) for new rows that duplicate earlier ones."""
+        d = d.sort_values(["account", "_amount_p", "_day", "dedup_id"], kind="mergesort").reset_index(drop=True)
+        acct = d["account"].to_numpy()
+        amt = d["_amount_p"].to_numpy()
+        day = d["_day"].to_numpy()
+        src = d["source"].to_numpy()
+        is_new = d["_new"].to_numpy()
+        n = len(d)
+
+        # Candidate pairs (i, i-lag): same block, within window, different source, i is new.
+        cand_i, cand_j = [], []
+        lag = 1
+        while lag < n:
+            i = np.arange(lag, n)
+            j = i - lag
+            in_window = (acct[i] == acct[j]) & (amt[i] == amt[j]) & (day[i] - day[j] <= self.window_days)
+            if not in_window.any():
+                break
+            sel = in_window & is_new[i] & (src[i] != src[j])
+            cand_i.append(i[sel])
+            cand_j.append(j[sel])
+            lag += 1
+        if not cand_i:
+            return pd.Series(dtype="int64"), pd.Series(dtype="float64")
+        ci = np.concatenate(cand_i)
+        cj = np.concatenate(cand_j)
+        if not len(ci):
+            return pd.Series(dtype="int64"), pd.Series(dtype="float64")
+
+        # Fuzzy text match on candidates only; nearest-in-date first.
+        order = np.lexsort((np.abs(day[ci] - day[cj]), ci))
+        ci, cj = ci[order], cj[order]
+        vendor = d["_vendor_n"].to_numpy()
+        desc = d["_desc_n"].to_numpy()
+        ids = d["dedup_id"].to_numpy()
+
+        canonical: dict[int, int] = {}      # row position -> canonical row position
+        absorbed: set[tuple[int, str]] = set()  # (canonical, source) pairs already used
+        merged, score = {}, {}
+        for i, j in zip(ci, cj):
+            if i in canonical:
+                continue
+            root = canonical.get(j, j)
+            if (root, src[i]) in absorbed or src[root] == src[i]:
+                continue
+            s = max(text_similarity(vendor[i], vendor[j]), text_similarity(desc[i], desc[j]))
+            if s < self.threshold:
+                continue
+            canonical[i] = root
+            absorbed.add((root, src[i]))
+            merged[ids[i]] = ids[root]
+            score[ids[i]] = s
+        return pd.Series(merged, dtype="int64"), pd.Series(score, dtype="float64")
+
+def deduplicate(frames: dict[str, pd.DataFrame], window_days: int = 3, threshold: float = 0.6) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """One-shot helper: {source_name: frame} -> (deduplicated transactions, merge report)."""
+    dd = TransactionDeduper(window_days=window_days, threshold=threshold)
+    for name, df in frames.items():
+        dd.add(df, source=name)
+    return dd.transactions(), dd.report
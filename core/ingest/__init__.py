@@ -0,0 +1 @@
+# ingest package
@@ -0,0 +1,316 @@
+"""
+Persistent ingest journal (SQLite) for data/raw → data/parsed.
+
+- `files`: every raw file seen, keyed by path, with its content hash, the
+  (size, mtime) used to skip re-hashing unchanged files and the parsed output
+  currently standing for it (superseded outputs are deleted).
+- `parses`: one row per content hash: parser, parser version, status, timing,
+  output dataset. Identical content under another name is never parsed twice;
+  bumping a parser version re-queues only that parser's files.
+- `datasets`: parsed outputs (CSV) with row count, a small preview and the
+  (size, mtime) they were read at, so the Home page never has to read CSVs and
+  files overwritten in place are picked up.
+
+`scan()` is the watcher: it stats every raw entry (cheap) and hashes only files
+whose (size, mtime) changed, so in-place overwrites are queued too.
+Listeners (`add_listener`) are called with (dataset path, frame) whenever a
+dataset is recorded and with (path, None) when one is removed, so in-memory
+indexes can be fed on ingest instead of re-reading the parsed directory.
+pandas is imported only by the calls that read or return frames, so Home can
+show its metrics before pandas has loaded.
+"""
+from __future__ import annotations
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from io import StringIO
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Optional
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# suffix -> (parser name, parser version, callable(Path) -> DataFrame or None if not available yet)
+Parser = tuple[str, str, Optional[Callable[[Path], "pd.DataFrame"]]]
+# (dataset path, frame) on record; (dataset path, None) on removal
+Listener = Callable[[str, Optional["pd.DataFrame"]], None]
+def _read_csv(path: Path, **kwargs) -> pd.DataFrame:
+    import pandas as pd
+    return pd.read_csv(path, **kwargs)
+
+PARSERS: dict[str, Parser] = {
+    ".pdf": ("bank_pdf", "0", None),
+    ".png": ("image_ocr", "0", None),
+    ".jpg": ("image_ocr", "0", None),
+    ".jpeg": ("image_ocr", "0", None),
+    ".csv": ("csv_passthrough", "1", _read_csv),
+}
+
+PREVIEW_ROWS = 20
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY, sha256 TEXT NOT NULL, size INTEGER, mtime_ns INTEGER, seen_at REAL, output TEXT
+);
+CREATE INDEX IF NOT EXISTS files_sha ON files(sha256);
+CREATE TABLE IF NOT EXISTS parses (
+    sha256 TEXT PRIMARY KEY, parser TEXT, parser_version TEXT, status TEXT,
+    started_at REAL, duration_s REAL, output TEXT, rows INTEGER, error TEXT
+);
+CREATE TABLE IF NOT EXISTS datasets (
+    path TEXT PRIMARY KEY, source TEXT, rows INTEGER, columns TEXT, created_at REAL, preview TEXT,
+    size INTEGER, mtime_ns INTEGER
+);
+"""
+# Columns added after the first release: (table, column, type) for ALTER TABLE on older journals.
+ADDED_COLUMNS = [("files", "output", "TEXT"), ("datasets", "size", "INTEGER"), ("datasets", "mtime_ns", "INTEGER")]
+
+def _stat(path) -> tuple[int | None, int | None]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None, None
+    return st.st_size, st.st_mtime_ns
+
+def _entries(directory: Path, suffix: str | None = None) -> dict[str, os.stat_result]:
+    """path -> stat for the regular files in `directory` (one scandir, no globbing)."""
+    if not directory.exists():
+        return {}
+    with os.scandir(directory) as it:
+        return {
+            e.path: e.stat() for e in it
+            if e.is_file() and (suffix is None or e.name.lower().endswith(suffix))
+        }
+
+def file_sha256(path: Path, chunk: int = 1 << 20) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(chunk), b""):
+            h.update(block)
+    return h.hexdigest()
+
+class IngestJournal:
+    def __init__(self, db_path: Path, parsers: dict[str, Parser] | None = None):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.parsers = PARSERS if parsers is None else parsers
+        self.listeners: list[Listener] = []
+        with self._conn() as c:
+            c.executescript(SCHEMA)
+            for table, col, typ in ADDED_COLUMNS:
+                if col not in {r[1] for r in c.execute(f"PRAGMA table_info({table})")}:
+                    c.execute(f"ALTER TABLE {table} ADD COLUMN {col} {typ}")
+
+    @contextmanager
+    def _conn(self):
+        # One short-lived connection per call: Streamlit reruns happen on different threads.
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def add_listener(self, fn: Listener) -> None:
+        if fn not in self.listeners:
+            self.listeners.append(fn)
+
+    def _notify(self, path, df) -> None:
+        for fn in self.listeners:
+            fn(str(path), df)
+
+    def _parser_for(self, path: str) -> Parser | None:
+        return self.parsers.get(Path(path).suffix.lower())
+
+    # ---------------- watcher ----------------
+    def scan(self, raw_dir: Path, force: bool = False) -> list[str]:
+        """
+        Sync `files` with raw_dir and return paths queued for parsing (new or
+        changed content, or parser version bumped). Every entry is stat'ed; only
+        files whose (size, mtime) changed are re-hashed (all of them with force).
+        """
+        raw_dir = Path(raw_dir)
+        entries = _entries(raw_dir)
+        with self._conn() as c:
+            known = {p: (size, mtime) for p, size, mtime in c.execute("SELECT path, size, mtime_ns FROM files")}
+            now = time.time()
+            for path, st in entries.items():
+                if not force and known.get(path) == (st.st_size, st.st_mtime_ns):
+                    continue
+                # Upsert keeps `output`, so the previous parse can be superseded in process().
+                c.execute(
+                    "INSERT INTO files(path, sha256, size, mtime_ns, seen_at) VALUES (?,?,?,?,?) "
+                    "ON CONFLICT(path) DO UPDATE SET sha256=excluded.sha256, size=excluded.size, "
+                    "mtime_ns=excluded.mtime_ns, seen_at=excluded.seen_at",
+                    (path, file_sha256(path), st.st_size, st.st_mtime_ns, now),
+                )
+            gone = [p for p in known if p not in entries and Path(p).parent == raw_dir]
+            c.executemany("DELETE FROM files WHERE path=?", [(p,) for p in gone])
+            # Copies of content that is already parsed are never queued; point them at its output.
+            c.execute(
+                "UPDATE files SET output=(SELECT p.output FROM parses p WHERE p.sha256=files.sha256) "
+                "WHERE output IS NULL"
+            )
+        return self.pending()
+
+    def pending(self) -> list[str]:
+        """Raw files whose content has no up-to-date parse (one path per distinct hash)."""
+        with self._conn() as c:
+            rows = c.execute(
+                "SELECT f.path, f.sha256, p.parser_version FROM files f "
+                "LEFT JOIN parses p ON p.sha256 = f.sha256 ORDER BY f.path"
+            ).fetchall()
+        out, seen = [], set()
+        for path, sha, version in rows:
+            parser = self._parser_for(path)
+            if parser is None or sha in seen:
+                continue
+            if version is None or version != parser[1]:
+                out.append(path)
+                seen.add(sha)
+        return out
+
+    # ---------------- parsing ----------------
+    def process(self, parsed_dir: Path, limit: int | None = None) -> list[dict]:
+        """Parse queued files, write each result to parsed_dir and journal it."""
+        results = []
+        for path in self.pending()[:limit]:
+            name, version, fn = self._parser_for(path)
+            with self._conn() as c:
+                sha = c.execute("SELECT sha256 FROM files WHERE path=?", (path,)).fetchone()[0]
+            started = time.time()
+            output, rows, error = None, None, None
+            if fn is None:
+                status, error = "unsupported", f"{name} parser not available yet"
+            else:
+                try:
+                    df = fn(Path(path))
+                    out = Path(parsed_dir) / f"{Path(path).stem}_{sha[:8]}.csv"
+                    df.to_csv(out, index=False)
+                    self.record_dataset(out, df, source=path)
+                    status, output, rows = "parsed", str(out), len(df)
+                    self._supersede(path, sha, output)
+                except Exception as e:
+                    status, error = "failed", f"{type(e).__name__}: {e}"
+            rec = {
+                "sha256": sha, "parser": name, "parser_version": version, "status": status,
+                "started_at": started, "duration_s": round(time.time() - started, 3),
+                "output": output, "rows": rows, "error": error,
+            }
+            with self._conn() as c:
+                c.execute(
+                    "INSERT OR REPLACE INTO parses VALUES (:sha256,:parser,:parser_version,:status,"
+                    ":started_at,:duration_s,:output,:rows,:error)", rec,
+                )
+            results.append({"path": path, **rec})
+        return results
+
+    def _supersede(self, path: str, sha: str, output: str) -> None:
+        """
+        Point every raw file with this content at `output`, and delete the output this
+        path had before (an in-place overwrite) unless another raw file still uses it.
+        """
+        with self._conn() as c:
+            row = c.execute("SELECT output FROM files WHERE path=?", (path,)).fetchone()
+            c.execute("UPDATE files SET output=? WHERE sha256=?", (output, sha))
+            old = row[0] if row else None
+            if not old or old == output or c.execute("SELECT 1 FROM files WHERE output=?", (old,)).fetchone():
+                return
+            c.execute("DELETE FROM datasets WHERE path=?", (old,))
+            c.execute("DELETE FROM parses WHERE output=?", (old,))
+        Path(old).unlink(missing_ok=True)
+        self._notify(old, None)
+
+    def _upsert_dataset(self, c, path: str, source: str | None, rows: int, columns, created_at: float, preview: str) -> None:
+        size, mtime_ns = _stat(path)
+        c.execute(
+            "INSERT INTO datasets(path, source, rows, columns, created_at, preview, size, mtime_ns) "
+            "VALUES (?,?,?,?,?,?,?,?) ON CONFLICT(path) DO UPDATE SET "
+            "source=COALESCE(excluded.source, datasets.source), rows=excluded.rows, columns=excluded.columns, "
+            "created_at=excluded.created_at, preview=excluded.preview, size=excluded.size, mtime_ns=excluded.mtime_ns",
+            (path, source, rows, json.dumps([str(col) for col in columns]), created_at, preview, size, mtime_ns),
+        )
+
+    def record_dataset(self, path: Path, df: pd.DataFrame, source: str = "") -> None:
+        """Register a parsed CSV (also used by demo/synthetic generators) with a small preview."""
+        preview = df.head(PREVIEW_ROWS).to_json(orient="split", date_format="iso", index=False)
+        with self._conn() as c:
+            self._upsert_dataset(c, str(path), source, len(df), df.columns, time.time(), preview)
+        self._notify(path, df)
+
+    def sync_datasets(self, parsed_dir: Path, force: bool = False) -> int:
+        """
+        Register CSVs in parsed_dir written outside `process()` (demo data, older
+        runs), re-read ones overwritten in place (size or mtime differs from what was
+        recorded) and forget deleted ones. Returns the number of CSVs (re)registered.
+        """
+        parsed_dir = Path(parsed_dir)
+        entries = _entries(parsed_dir, ".csv")
+        with self._conn() as c:
+            known = {p: (size, mtime) for p, size, mtime in c.execute("SELECT path, size, mtime_ns FROM datasets")}
+        added = 0
+        for path, st in entries.items():
+            if not force and known.get(path) == (st.st_size, st.st_mtime_ns):
+                continue
+            try:
+                if self.listeners:  # they need the whole frame anyway
+                    df = _read_csv(path)
+                    head, rows = df.head(PREVIEW_ROWS), len(df)
+                else:
+                    df, head = None, _read_csv(path, nrows=PREVIEW_ROWS)
+                    with open(path, "rb") as f:
+                        rows = max(sum(1 for _ in f) - 1, 0)
+            except Exception:
+                continue
+            with self._conn() as c:
+                self._upsert_dataset(c, path, None, rows, head.columns, st.st_mtime,
+                                     head.to_json(orient="split", date_format="iso", index=False))
+            if df is not None:
+                self._notify(path, df)
+            added += 1
+        gone = [p for p in known if p not in entries and Path(p).parent == parsed_dir]
+        with self._conn() as c:
+            c.executemany("DELETE FROM datasets WHERE path=?", [(p,) for p in gone])
+        for p in gone:
+            self._notify(p, None)
+        return added
+
+    # ---------------- queries for the UI ----------------
+    def datasets(self) -> list[str]:
+        """Paths of the recorded datasets, oldest first."""
+        with self._conn() as c:
+            return [p for (p,) in c.execute("SELECT path FROM datasets ORDER BY created_at")]
+
+    def stats(self) -> dict:
+        with self._conn() as c:
+            raw = c.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+            datasets = c.execute("SELECT COUNT(*) FROM datasets").fetchone()[0]
+            by_status = dict(c.execute(
+                "SELECT p.status, COUNT(*) FROM files f JOIN parses p ON p.sha256 = f.sha256 GROUP BY p.status"
+            ).fetchall())
+        return {"raw_files": raw, "datasets": datasets, "pending": len(self.pending()), **by_status}
+
+    def latest_preview(self) -> tuple[str, pd.DataFrame] | None:
+        """(dataset path, first rows) of the most recently recorded dataset that still exists."""
+        with self._conn() as c:
+            rows = c.execute("SELECT path, preview FROM datasets ORDER BY created_at DESC").fetchall()
+        for path, preview in rows:
+            if Path(path).exists():
+                import pandas as pd
+                return path, pd.read_json(StringIO(preview), orient="split")
+            with self._conn() as c:
+                c.execute("DELETE FROM datasets WHERE path=?", (path,))
+            self._notify(path, None)
+        return None
+
+    def history(self) -> pd.DataFrame:
+        import pandas as pd
+        with self._conn() as c:
+            return pd.read_sql_query(
+                "SELECT f.path, f.sha256, p.parser, p.parser_version, p.status, p.started_at, "
+                "p.duration_s, p.output, p.rows, p.error FROM files f LEFT JOIN parses p ON p.sha256 = f.sha256 "
+                "ORDER BY f.seen_at DESC", c,
+            )
@@ -0,0 +1,246 @@
+"""
+Bulk (columnar) validation against the pydantic models in core.models.
+
+Parsers produce whole frames; building one BaseModel per row is slow and
+memory-hungry at statement scale. `check_frame` validates every column of a
+DataFrame (or a pyarrow Table/RecordBatch) in one vectorised pass, using the
+model's own field names, types and defaults, and reports problems in the same
+shape as pydantic: `ValidationError.errors()` dicts with loc=(row, field).
+One deliberate difference: a missing cell (None/NaN/NA — what a blank CSV cell
+becomes) in a required float field is a `float_type` error, although pydantic
+accepts float('nan'); a blank amount is not a number.
+
+Use `record_type` / `iter_records` only where single objects are really needed
+(e.g. one waterfall row); they are compact __slots__ dataclasses.
+"""
+from __future__ import annotations
+import dataclasses
+import datetime as dt
+import types
+from functools import lru_cache
+from typing import Any, Iterator, Union, get_args, get_origin
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+_SCALARS = {dt.date: "date", str: "str", float: "float"}
+_ISO_DATE = r"\d{4}-\d{2}-\d{2}"
+_DATE = TypeAdapter(dt.date)
+_FLOAT = TypeAdapter(float)
+_DECIMAL = r"[+-]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?"
+
+def _field_kind(annotation: Any) -> tuple[str, bool, Any]:
+    """Return (kind, optional, inner) for a model annotation."""
+    optional = False
+    origin = get_origin(annotation)
+    if origin in (Union, types.UnionType):
+        args = [a for a in get_args(annotation) if a is not type(None)]
+        optional = len(args) < len(get_args(annotation))
+        annotation = args[0] if len(args) == 1 else annotation
+        origin = get_origin(annotation)
+    if annotation in _SCALARS:
+        return _SCALARS[annotation], optional, annotation
+    if origin is list:
+        return "nested", optional, annotation
+    raise TypeError(f"Unsupported field type for columnar validation: {annotation!r}")
+
+def _as_frame(data) -> pd.DataFrame:
+    if isinstance(data, pd.DataFrame):
+        return data
+    if hasattr(data, "to_pandas"):  # pyarrow Table / RecordBatch
+        return data.to_pandas()
+    return pd.DataFrame(data)
+
+def _errors(kind: str, pos, values, field: str, ctx: dict | None = None) -> list[dict]:
+    out = []
+    for p, v in zip(pos, values):
+        e = {"type": kind, "loc": (int(p), field), "input": None if _isnull(v) else v}
+        if ctx:
+            e["ctx"] = ctx
+        out.append(e)
+    return out
+
+def _isnull(v) -> bool:
+    return v is None or (isinstance(v, float) and v != v) or v is pd.NaT or v is pd.NA
+
+def _check_str(col: pd.Series, optional: bool, field: str, pos) -> tuple[pd.Series, list[dict]]:
+    null = col.isna().to_numpy()
+    if isinstance(col.dtype, pd.CategoricalDtype):
+        # Check each category once; code -1 (null) maps to the trailing True.
+        cat_ok = np.append([isinstance(c, str) for c in col.cat.categories], True).astype(bool)
+        bad = np.where(null, not optional, ~cat_ok[col.cat.codes.to_numpy()])
+    elif pd.api.types.is_string_dtype(col.dtype) and col.dtype != object:
+        bad = null & (not optional)
+    elif col.dtype == object:
+        is_str = col.map(lambda v: isinstance(v, str)).to_numpy(dtype=bool)
+        bad = ~is_str & (~null | (not optional))
+    else:  # numeric/bool/datetime columns are not strings
+        bad = ~null | (not optional)
+    out = col.astype(object).where(~null, None)
+    return out, _errors("string_type", pos[bad], col.to_numpy()[bad], field)
+
+def _pydantic_each(values: np.ndarray, rows, field: str, adapter: TypeAdapter, fill) -> tuple[np.ndarray, list[dict]]:
+    """Validate each distinct value once with `adapter`; returns (validated per row, errors as pydantic reports them)."""
+    codes, uniques = pd.factorize(pd.Series(values, dtype=object))
+    ok = np.full(len(uniques), fill)
+    errs = []
+    for i, v in enumerate(uniques):
+        try:
+            ok[i] = adapter.validate_python(v)
+        except ValidationError as e:
+            sub = e.errors(include_url=False)[0]
+            errs += [
+                {"type": sub["type"], "loc": (int(p), field), "input": v, **({"ctx": sub["ctx"]} if "ctx" in sub else {})}
+                for p in rows[codes == i]
+            ]
+    return ok[codes], errs
+
+def _check_float(col: pd.Series, optional: bool, field: str, pos) -> tuple[pd.Series, list[dict]]:
+    errs = []
+    null = col.isna().to_numpy()
+    if pd.api.types.is_numeric_dtype(col.dtype) and not pd.api.types.is_bool_dtype(col.dtype):
+        out = col.astype("float64")
+    else:
+        # Fast path: plain decimal strings and int/float objects. Anything else ("1_000",
+        # " 1.5 ", "nan", bools, junk) goes through pydantic once per distinct value.
+        values = col.astype(object).to_numpy()
+        if pd.api.types.is_string_dtype(col.dtype):  # object or str
+            decimal = col.astype("string").str.fullmatch(_DECIMAL).fillna(False).to_numpy(dtype=bool)
+            is_str = col.map(lambda v: isinstance(v, str)).to_numpy(dtype=bool)
+            is_num = col.map(lambda v: type(v) in (int, float)).to_numpy(dtype=bool)
+            fast = (is_str & decimal) | is_num
+        else:
+            fast = np.zeros(len(col), dtype=bool)
+        fast &= ~null
+        out = np.full(len(col), np.nan)
+        out[fast] = pd.to_numeric(pd.Series(values[fast], dtype=object)).to_numpy(dtype="float64")
+        rest = ~null & ~fast
+        if rest.any():
+            out[rest], e = _pydantic_each(values[rest], pos[rest], field, _FLOAT, np.nan)
+            errs += e
+        out = pd.Series(out, index=col.index, dtype="float64")
+    if not optional:
+        errs += _errors("float_type", pos[null], col.to_numpy()[null], field)
+    return out, errs
+
+def _check_date(col: pd.Series, optional: bool, field: str, pos) -> tuple[pd.Series, list[dict]]:
+    errs = []
+    null = col.isna().to_numpy()
+    if pd.api.types.is_datetime64_any_dtype(col.dtype):
+        parsed = col
+        inexact = (parsed != parsed.dt.normalize()).to_numpy() & parsed.notna().to_numpy()
+        errs += _errors("date_from_datetime_inexact", pos[inexact], col.to_numpy()[inexact], field)
+    else:
+        # Fast path: full YYYY-MM-DD strings. Everything else (partial dates, datetimes,
+        # out-of-range days, numbers) goes through pydantic once per distinct value, so
+        # what is accepted and the error type/ctx are exactly pydantic's.
+        text = col.astype("string")
+        iso = text.str.fullmatch(_ISO_DATE).fillna(False).to_numpy(dtype=bool)
+        parsed = pd.to_datetime(text.where(iso), format="%Y-%m-%d", errors="coerce")
+        rest = ~null & parsed.isna().to_numpy()
+        if rest.any():
+            filled = parsed.to_numpy(dtype="datetime64[ns]", copy=True)
+            filled[rest], e = _pydantic_each(col.astype(object).to_numpy()[rest], pos[rest], field, _DATE, np.datetime64("NaT", "ns"))
+            errs += e
+            parsed = pd.Series(filled, index=col.index)
+    if not optional:
+        errs += _errors("date_type", pos[null], col.to_numpy()[null], field)
+    return parsed.dt.normalize(), errs
+
+def _check_nested(col: pd.Series, optional: bool, field: str, pos, annotation) -> tuple[pd.Series, list[dict]]:
+    # Nested line items have no columnar layout; validate just this column per value.
+    adapter = TypeAdapter(annotation)
+    errs, out = [], []
+    for p, v in zip(pos, col.to_numpy()):
+        if not isinstance(v, (list, tuple)) and _isnull(v):
+            out.append(None)
+            if not optional:
+                errs.append({"type": "list_type", "loc": (int(p), field), "input": None})
+            continue
+        try:
+            out.append(adapter.validate_python(v))
+        except ValidationError as e:
+            out.append(None)
+            for sub in e.errors(include_url=False):
+                errs.append({**{k: sub[k] for k in ("type", "input", "ctx") if k in sub}, "loc": (int(p), field, *sub["loc"])})
+    return pd.Series(out, index=col.index, dtype=object), errs
+
+def check_frame(data, model: type[BaseModel], keep_extra: bool = False) -> tuple[pd.DataFrame, list[dict]]:
+    """
+    Validate a frame/Arrow batch against `model` column by column.
+    Returns (valid rows with coerced dtypes, pydantic-style error dicts).
+    Dates come back as datetime64 (midnight), numbers as float64, strings as object.
+    """
+    df = _as_frame(data)
+    n = len(df)
+    pos = pd.RangeIndex(n).to_numpy()
+    out = pd.DataFrame(index=df.index)
+    errs: list[dict] = []
+    order = {name: i for i, name in enumerate(model.model_fields)}
+
+    for name, field in model.model_fields.items():
+        kind, optional, inner = _field_kind(field.annotation)
+        if name not in df.columns:
+            if field.is_required():
+                errs += [{"type": "missing", "loc": (int(p), name), "input": {}} for p in pos]
+                continue
+            out[name] = pd.Series([field.get_default(call_default_factory=True)] * n, index=df.index, dtype=object)
+            if kind == "float":
+                out[name] = out[name].astype("float64")
+            continue
+        col = df[name]
+        if isinstance(col.dtype, pd.CategoricalDtype) and kind != "str":
+            col = col.astype(object)  # e.g. Arrow dictionary arrays; only str checks use the categories
+        if kind == "str":
+            out[name], e = _check_str(col, optional, name, pos)
+        elif kind == "float":
+            out[name], e = _check_float(col, optional, name, pos)
+        elif kind == "date":
+            out[name], e = _check_date(col, optional, name, pos)
+        else:
+            out[name], e = _check_nested(col, optional, name, pos, inner)
+        errs += e
+
+    if keep_extra:
+        extra = [c for c in df.columns if c not in order]
+        out = pd.concat([out, df[extra]], axis=1)
+
+    if errs:
+        errs.sort(key=lambda e: (e["loc"][0], order.get(e["loc"][1], len(order))))
+        bad = sorted({e["loc"][0] for e in errs})
+        out = out.drop(index=df.index[bad])
+        # Round-trip through pydantic so messages match ValidationError.errors() exactly.
+        errs = ValidationError.from_exception_data(model.__name__, errs).errors(include_url=False)
+    return out, errs
+
+def validate_frame(data, model: type[BaseModel], keep_extra: bool = False) -> pd.DataFrame:
+    """Like `check_frame` but raises pydantic.ValidationError if any row is invalid."""
+    out, errs = check_frame(data, model, keep_extra=keep_extra)
+    if errs:
+        raise ValidationError.from_exception_data(
+            f"list[{model.__name__}]",
+            [{k: e[k] for k in ("type", "loc", "input", "ctx") if k in e} for e in errs],
+        )
+    return out
+
+@lru_cache(maxsize=None)
+def record_type(model: type[BaseModel]) -> type:
+    """Frozen __slots__ dataclass with the same fields as `model` (no validation)."""
+    fields = [
+        (name, f.annotation, dataclasses.field(default=f.default)) if not f.is_required() else (name, f.annotation)
+        for name, f in model.model_fields.items()
+    ]
+    fields.sort(key=lambda x: len(x) == 3)  # non-defaults first
+    return dataclasses.make_dataclass(f"{model.__name__}Record", fields, slots=True, frozen=True)
+
+def iter_records(frame: pd.DataFrame, model: type[BaseModel]) -> Iterator[Any]:
+    """Yield compact records from a frame already validated with `check_frame`."""
+    cls = record_type(model)
+    names = [f.name for f in dataclasses.fields(cls)]
+    cols = {}
+    for name in names:
+        kind, _, _ = _field_kind(model.model_fields[name].annotation)
+        cols[name] = frame[name].dt.date if kind == "date" else frame[name]
+    for row in zip(*(cols[n].tolist() for n in names)):
+        yield cls(*row)
@@ -1 +1,2 @@
 # TODO: Implement Airbnb PDF parsing; extract statement rate for EUR→GBP.
+# Import pdfplumber inside the parse function, not at module level (core/perf/imports.py).
@@ -1,3 +1,4 @@
 # TODO: Implement bank/Revolut PDF parsing via pdfplumber/camelot/tabula.
 # Should output normalised CSV with columns:
 # date, vendor, description, amount, currency, account
+# Import pdfplumber/camelot/tabula inside the parse function, not at module level (core/perf/imports.py).
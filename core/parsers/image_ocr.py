@@ -1 +1,2 @@
 # TODO: Implement image/screenshot OCR using Tesseract to extract table rows.
+# Import pytesseract/PIL inside the parse function, not at module level (core/perf/imports.py).
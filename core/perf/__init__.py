@@ -0,0 +1 @@
+# perf package
@@ -0,0 +1,139 @@
+"""
+Startup cost: heavy third-party imports are deferred to the feature that needs
+them (plotting, Excel/PDF export, PDF/OCR parsing, YAML rules), and `prewarm()`
+loads them in a background thread once per server process so the first page
+that does need them finds them in sys.modules.
+
+`import_report()` measures cold import times in fresh interpreters
+(`python -X importtime`) and lists which heavy modules each one pulls in:
+
+    python -m core.perf.imports                      # every core module + app._bootstrap
+    python -m core.perf.imports streamlit pandas --budget-ms 800
+"""
+from __future__ import annotations
+import argparse
+import pkgutil
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+
+# Top-level packages that must only be imported where a feature uses them.
+# (pyarrow is not listed: pandas >= 3 loads it for its string dtype.)
+HEAVY_MODULES = (
+    "plotly", "kaleido", "yaml", "openpyxl", "reportlab", "weasyprint",
+    "pdfplumber", "camelot", "tabula", "fitz", "pytesseract", "PIL", "pdf2image",
+)
+# Loaded by prewarm(), cheapest-to-need-first; missing optional packages are skipped.
+PREWARM_MODULES = (
+    "pandas", "plotly.graph_objects", "plotly.express", "yaml", "pyarrow", "pyarrow.csv",
+    "openpyxl", "pdfplumber", "camelot", "fitz", "pytesseract",
+)
+
+# Non-core modules every page imports first (pages themselves run Streamlit on import).
+APP_MODULES = ("app._bootstrap",)
+
+def core_modules() -> list[str]:
+    import core
+    return sorted(m.name for m in pkgutil.walk_packages(core.__path__, "core."))
+
+def checked_modules() -> list[str]:
+    """Modules that must not import HEAVY_MODULES at import time."""
+    return core_modules() + list(APP_MODULES)
+
+def _warm_charts() -> None:
+    """Build and serialise a tiny figure (loads templates/validators) and start kaleido if present."""
+    import plotly.express as px
+    px.line(x=[0, 1], y=[0, 1]).to_json()
+    try:
+        import kaleido
+    except ImportError:
+        return
+    if hasattr(kaleido, "start_sync_server"):  # kaleido >= 1: keep one browser for all write_image calls
+        import atexit
+        kaleido.start_sync_server(silence_warnings=True)
+        atexit.register(kaleido.stop_sync_server, silence_warnings=True)
+
+def prewarm(modules=PREWARM_MODULES, charts: bool = True) -> threading.Thread:
+    """
+    Import `modules` (and warm the chart renderer) in a daemon thread. Returns
+    the thread; `thread.timings` maps module -> seconds (None if not installed).
+    """
+    timings: dict[str, float | None] = {}
+
+    def run():
+        for name in modules:
+            t0 = time.perf_counter()
+            try:
+                __import__(name)
+                timings[name] = round(time.perf_counter() - t0, 3)
+            except Exception:
+                timings[name] = None
+        if charts:
+            t0 = time.perf_counter()
+            try:
+                _warm_charts()
+                timings["<charts>"] = round(time.perf_counter() - t0, 3)
+            except Exception:
+                timings["<charts>"] = None
+
+    t = threading.Thread(target=run, name="prewarm", daemon=True)
+    t.timings = timings
+    t.start()
+    return t
+
+_PROBE = """
+import sys, {module}
+print(" ".join(sorted({{m.split(".")[0] for m in sys.modules}})))
+"""
+
+def probe_import(module: str) -> tuple[float, set[str]]:
+    """
+    Import `module` in a fresh interpreter under `-X importtime`. Returns its
+    cumulative import time in ms and the top-level packages it left loaded.
+    """
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE.format(module=module)],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    # importtime lines: "import time: self [us] | cumulative | name"; the requested module is the
+    # last top-level (unindented) entry with that name.
+    cumulative = 0
+    for line in out.stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].rstrip() == f" {module}":
+            cumulative = int(parts[1])
+    return cumulative / 1000, set(out.stdout.split())
+
+def heavy_imports(module: str) -> list[str]:
+    """HEAVY_MODULES that `module` imports at import time (should be empty for checked_modules())."""
+    loaded = probe_import(module)[1]
+    return [m for m in HEAVY_MODULES if m in loaded]
+
+def import_report(modules=None) -> list[dict]:
+    """One row per module: cold import time and heavy modules pulled in, slowest first."""
+    rows = []
+    for m in modules or checked_modules():
+        ms, loaded = probe_import(m)
+        rows.append({"module": m, "import_ms": round(ms, 1), "heavy": [h for h in HEAVY_MODULES if h in loaded]})
+    return sorted(rows, key=lambda r: r["import_ms"], reverse=True)
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Cold import-time report (fresh interpreter per module).")
+    ap.add_argument("modules", nargs="*", help="default: every core module and app._bootstrap")
+    ap.add_argument("--budget-ms", type=float, default=None, help="exit 1 if any module is slower")
+    a = ap.parse_args(argv)
+    rows = import_report(a.modules or None)
+    failed = False
+    for r in rows:
+        over = a.budget_ms is not None and r["import_ms"] > a.budget_ms
+        failed |= over
+        heavy = ", ".join(r["heavy"]) or "-"
+        print(f"{r['import_ms']:>9.1f} ms  {r['module']:<32} heavy: {heavy}{'  OVER BUDGET' if over else ''}")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
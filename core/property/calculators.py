@@ -1,6 +1,8 @@
 from __future__ import annotations
 import pandas as pd
 
+from core.convert.fx import eur_to_gbp_pence
+
 REQUIRED_COLS = [
     "date", "nights", "currency", "statement_rate",
     "income_eur", "cleaning_eur", "platform_fees_eur", "taxes_eur", "other_eur"
@@ -15,15 +17,15 @@ def coerce_airbnb(df: pd.DataFrame) -> pd.DataFrame:
     # numeric
     num = [c for c in REQUIRED_COLS if c not in ("date","currency")]
     df[num] = df[num].apply(pd.to_numeric, errors="coerce").fillna(0.0)
-    # derived GBP
-    rate = df["statement_rate"].replace(0, pd.NA).fillna(1.0)  # fallback
-    df["income_gbp"]   = (df["income_eur"]   / rate).round(2)
-    df["cleaning_gbp"] = (df["cleaning_eur"] / rate).round(2)
-    df["fees_gbp"]     = (df["platform_fees_eur"] / rate).round(2)
-    df["taxes_gbp"]    = (df["taxes_eur"] / rate).round(2)
-    df["other_gbp"]    = (df["other_eur"]  / rate).round(2)
-    df["outgoings_gbp"] = (df["cleaning_gbp"] + df["fees_gbp"] + df["taxes_gbp"] + df["other_gbp"]).round(2)
-    df["net_gbp"] = (df["income_gbp"] - df["outgoings_gbp"]).round(2)
+    # derived GBP, int64 pence (see core.convert.money)
+    rate = df["statement_rate"]
+    df["income_gbp_p"]   = eur_to_gbp_pence(df["income_eur"], rate)
+    df["cleaning_gbp_p"] = eur_to_gbp_pence(df["cleaning_eur"], rate)
+    df["fees_gbp_p"]     = eur_to_gbp_pence(df["platform_fees_eur"], rate)
+    df["taxes_gbp_p"]    = eur_to_gbp_pence(df["taxes_eur"], rate)
+    df["other_gbp_p"]    = eur_to_gbp_pence(df["other_eur"], rate)
+    df["outgoings_gbp_p"] = df["cleaning_gbp_p"] + df["fees_gbp_p"] + df["taxes_gbp_p"] + df["other_gbp_p"]
+    df["net_gbp_p"] = df["income_gbp_p"] - df["outgoings_gbp_p"]
     return df.dropna(subset=["date"]).sort_values("date")
 
 def monthly_summary(df: pd.DataFrame) -> pd.DataFrame:
@@ -31,7 +33,7 @@ def monthly_summary(df: pd.DataFrame) -> pd.DataFrame:
     s = pd.DataFrame(df)
     s["month"] = pd.to_datetime(s["date"]).dt.to_period("M").astype(str)
     grp = s.groupby("month", as_index=False).agg({
-        "income_gbp":"sum","fees_gbp":"sum","taxes_gbp":"sum","cleaning_gbp":"sum","other_gbp":"sum","net_gbp":"sum","nights":"sum"
+        "income_gbp_p":"sum","fees_gbp_p":"sum","taxes_gbp_p":"sum","cleaning_gbp_p":"sum","other_gbp_p":"sum","net_gbp_p":"sum","nights":"sum"
     })
     return grp
 
@@ -0,0 +1 @@
+# spending package
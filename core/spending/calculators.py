@@ -0,0 +1,36 @@
+from __future__ import annotations
+import pandas as pd
+
+from core.convert.money import to_pence
+
+def coerce_spending(df: pd.DataFrame) -> pd.DataFrame:
+    """Ensure `date` is datetime and `amount_p` (int64 pence) exists; negative = outflow."""
+    df = df.copy()
+    df["date"] = pd.to_datetime(df["date"], errors="coerce")
+    if "amount_p" not in df.columns:
+        df["amount_p"] = to_pence(df["amount"])
+    if "category" not in df.columns:
+        df["category"] = "Uncategorized"
+    return df.dropna(subset=["date"])
+
+def monthly_by_category(df: pd.DataFrame) -> pd.DataFrame:
+    """Outgoings per month and category as positive pence: columns month, category, spend_p, count."""
+    s = coerce_spending(df)
+    s = s[s["amount_p"] < 0]
+    s["month"] = s["date"].dt.to_period("M").astype(str)
+    s["spend_p"] = -s["amount_p"]
+    grp = s.groupby(["month", "category"], as_index=False).agg(spend_p=("spend_p", "sum"), count=("spend_p", "size"))
+    return grp.sort_values(["month", "category"]).reset_index(drop=True)
+
+def category_totals(df: pd.DataFrame, mapping: dict | None = None) -> pd.DataFrame:
+    """
+    Total outgoings per category (pence) with monthly average over the months covered.
+    If `mapping` (category -> Form E1 section) is given, a `section` column is added.
+    """
+    m = monthly_by_category(df)
+    n_months = max(m["month"].nunique(), 1)
+    tot = m.groupby("category", as_index=False).agg(spend_p=("spend_p", "sum"), count=("count", "sum"))
+    tot["monthly_avg_p"] = (tot["spend_p"] / n_months).round().astype("int64")
+    if mapping is not None:
+        tot["section"] = tot["category"].map(mapping).fillna("Section 3 – Other")
+    return tot.sort_values("spend_p", ascending=False).reset_index(drop=True)
@@ -0,0 +1,257 @@
+from __future__ import annotations
+import numpy as np
+import pandas as pd
+
+from core.dedup.transactions import normalize_text
+from core.spending.calculators import coerce_spending
+
+# name -> (nominal days, tolerance days, calendar step, payments per month)
+PERIODS = {
+    "weekly":    (7.0,    1.5, pd.DateOffset(weeks=1),  52 / 12),
+    "monthly":   (30.44,  4.0, pd.DateOffset(months=1), 1.0),
+    "quarterly": (91.31, 10.0, pd.DateOffset(months=3), 1 / 3),
+    "annual":    (365.25, 20.0, pd.DateOffset(years=1), 1 / 12),
+}
+
+# Two payments a year apart only count as an annual series if the amount is identical,
+# the gap is this close to a year and they dominate the vendor (see MIN_SHARE);
+# otherwise annual needs `min_count` payments like the other periods.
+ANNUAL_PAIR_TOL_DAYS = 7.0
+# Variable-amount series, annual pairs and short fixed series (< 2 * min_count payments)
+# must be at least this share of the account's payments to that vendor: at a shop used
+# every week, a few payments that happen to line up with a period (even to the penny)
+# are coincidence, not a bill.
+MIN_SHARE = 0.5
+
+SERIES_COLS = [
+    "account", "vendor_key", "vendor", "category", "period", "interval_days", "regularity", "count",
+    "first_date", "last_date", "next_date", "amount_p", "last_amount_p", "monthly_p",
+    "missed", "changed", "status",
+]
+GROUP = ["account", "vendor_key"]
+
+def vendor_key(vendor: pd.Series, words: int = 3) -> pd.Series:
+    """Normalised vendor used for grouping: first `words` alphabetic tokens (drops refs/card numbers)."""
+    codes, uniques = pd.factorize(vendor.astype(object).fillna("").astype(str))
+    keys = normalize_text(pd.Series(uniques)).str.split(" ").str[:words].str.join(" ")
+    return pd.Series(keys.to_numpy()[codes], index=vendor.index)
+
+def _amount_bands(d: pd.DataFrame, band: float) -> pd.Series:
+    """Within an account+vendor, cluster payments whose sorted amounts stay within `band` of each other."""
+    d = d.assign(_abs=d["amount_p"].abs()).sort_values([*GROUP, "_abs"], kind="mergesort")
+    prev = d["_abs"].shift()
+    same = (d["account"] == d["account"].shift()) & (d["vendor_key"] == d["vendor_key"].shift())
+    new_band = ~same | (d["_abs"] > prev * (1 + band))
+    return new_band.cumsum().reindex(d.index)
+
+def _summarise(s: pd.DataFrame, key: str) -> pd.DataFrame:
+    """
+    Per cluster `key`: counts, dates, amounts, nearest nominal period to the median
+    interval (None if outside tolerance) and regularity (share of intervals that fit it).
+    """
+    s = s.sort_values([key, "date"], kind="mergesort")
+    g = s.groupby(key)
+    interval = g["date"].diff().dt.days
+    prev_amount = g["amount_p"].shift()
+    s = s.assign(interval=interval, prev_amount_p=prev_amount,
+                 amount_change=prev_amount.notna() & (s["amount_p"] != prev_amount))
+    out = s.groupby(key).agg(
+        account=("account", "first"),
+        vendor_key=("vendor_key", "first"),
+        vendor=("vendor", "last"),
+        category=("category", "last"),
+        count=("date", "size"),
+        vendor_count=("vendor_count", "first"),
+        first_date=("date", "min"),
+        last_date=("date", "max"),
+        interval_days=("interval", "median"),
+        amount_p=("amount_p", "median"),
+        last_amount_p=("amount_p", "last"),
+        amount_changes=("amount_change", "sum"),
+    )
+    names = list(PERIODS)
+    nominal = np.array([PERIODS[n][0] for n in names])
+    tol = np.array([PERIODS[n][1] for n in names])
+    dist = np.abs(out["interval_days"].to_numpy()[:, None] - nominal[None, :])
+    best = dist.argmin(axis=1)
+    ok = dist[np.arange(len(out)), best] <= tol[best]
+    out["period"] = np.where(ok, np.array(names, dtype=object)[best], None)
+
+    per_row = out["period"].reindex(s[key]).to_numpy()
+    row_nom = pd.Series(per_row).map({n: PERIODS[n][0] for n in names}).to_numpy(dtype=float)
+    row_tol = pd.Series(per_row).map({n: PERIODS[n][1] for n in names}).to_numpy(dtype=float)
+    hit = np.abs(s["interval"].to_numpy() - row_nom) <= row_tol
+    hit = np.where(s["interval"].isna().to_numpy(), np.nan, hit.astype(float))  # float keeps groupby on the fast path
+    out["regularity"] = pd.Series(hit, index=s.index).groupby(s[key]).mean().reindex(out.index)
+    return out
+
+def _qualifies(out: pd.DataFrame, min_count: int, exact) -> pd.Series:
+    """`exact`: whether each cluster has a fixed amount (bool or boolean array)."""
+    dominant = out["count"] >= MIN_SHARE * out["vendor_count"]
+    annual_pair = (
+        exact & dominant & (out["period"] == "annual") & (out["count"] >= 2)
+        & ((out["interval_days"] - PERIODS["annual"][0]).abs() <= ANNUAL_PAIR_TOL_DAYS)
+    )
+    enough = (out["count"] >= min_count) & (dominant | (exact & (out["count"] >= 2 * min_count)))
+    return out["period"].notna() & (out["regularity"] >= 0.6) & (enough | annual_pair)
+
+def _chain_exact(e: pd.DataFrame, qualified: pd.Series, band: float) -> pd.Series:
+    """
+    Link each qualifying exact-amount cluster with the clusters that continue it at a new
+    price (next payment one period after its last, amount within `band`), in both
+    directions. Returns exact cluster id -> id of the series it belongs to.
+
+    Per period, every cluster of that period (or too short to have one) is linked to the
+    earliest cluster starting one period after its last payment, found with one
+    searchsorted over (vendor, first date) for all vendors at once; each cluster keeps one
+    predecessor, so the links form paths, and paths holding a qualifying cluster are series.
+    """
+    keys = pd.MultiIndex.from_frame(e[GROUP])
+    cand = e[keys.isin(pd.MultiIndex.from_frame(e.loc[qualified, GROUP]))]
+    if cand.empty:
+        return pd.Series(dtype="int64")
+    ids = cand.index.to_numpy()
+    group = cand.groupby(GROUP, sort=False, observed=True).ngroup().to_numpy().astype("int64")
+    first = cand["first_date"].to_numpy("datetime64[D]").astype("int64")
+    last = cand["last_date"].to_numpy("datetime64[D]").astype("int64")
+    first, last = first - first.min(), last - first.min()
+    amount = cand["amount_p"].to_numpy(dtype=float)
+    period = cand["period"].to_numpy(dtype=object)
+    q = qualified.reindex(cand.index).to_numpy(dtype=bool)
+    series = np.full(len(cand), -1, dtype="int64")
+    for name, (days, tol, _, _) in PERIODS.items():
+        node = (series < 0) & ((period == name) | (period == None))  # noqa: E711 (object array)
+        if not (node & q).any():
+            continue
+        idx = np.flatnonzero(node)
+        # One sorted key for all vendors: group * width + first day (width > any date + period).
+        width = int(last.max()) + int(days + tol) + 2
+        order = idx[np.lexsort((first[idx], group[idx]))]
+        sorted_key = group[order] * width + first[order]
+        target = group[idx] * width + last[idx] + days
+        lo = np.searchsorted(sorted_key, target - tol)
+        n = np.searchsorted(sorted_key, target + tol, side="right") - lo
+        src = np.repeat(idx, n)
+        dst = order[np.repeat(lo - (np.cumsum(n) - n), n) + np.arange(n.sum())]
+        ok = (dst != src) & (np.abs(amount[dst] - amount[src]) <= band * amount[src])
+        src, dst = src[ok], dst[ok]
+        # Forward: the earliest continuation per cluster; backward: the latest-ending predecessor.
+        o = np.lexsort((first[dst], src))
+        src, dst = src[o], dst[o]
+        keep = np.unique(src, return_index=True)[1]
+        src, dst = src[keep], dst[keep]
+        o = np.lexsort((-last[src], dst))
+        src, dst = src[o], dst[o]
+        keep = np.unique(dst, return_index=True)[1]
+        src, dst = src[keep], dst[keep]
+        # Path heads by pointer jumping (log of the longest path).
+        head = np.arange(len(cand))
+        head[dst] = src
+        while True:
+            nxt = head[head]
+            if np.array_equal(nxt, head):
+                break
+            head = nxt
+        has_q = np.bincount(head[idx], weights=q[idx], minlength=len(cand)) > 0
+        member = idx[has_q[head[idx]]]
+        series[member] = ids[head[member]]
+    chained = series >= 0
+    return pd.Series(series[chained], index=ids[chained], dtype="int64")
+
+def detect_recurring(df: pd.DataFrame, as_of=None, band: float = 0.25, min_count: int = 3) -> pd.DataFrame:
+    """
+    Find regular outgoings (weekly/monthly/quarterly/annual) in a transactions frame
+    (date, vendor, amount or amount_p, optional account and category), per account.
+
+    Payments are clustered on their exact amount first, so a fixed direct debit is not
+    diluted by other spend at the same vendor; clusters one period apart at a nearby
+    amount are joined as one series with a price change. Whatever is left is clustered
+    by amount `band` to catch variable bills. No Python loop per vendor or cluster.
+
+    Returns one row per detected series with the typical amount (pence), the
+    monthly equivalent for Form E1, the expected next date and flags for
+    missed (overdue as of `as_of`) or changed (last amount differs) payments.
+    """
+    s = coerce_spending(df)
+    s = s[s["amount_p"] < 0]
+    if s.empty:
+        return pd.DataFrame(columns=SERIES_COLS)
+    account = s["account"].fillna("Unknown").astype(str) if "account" in s.columns else "Unknown"
+    s = s.assign(account=account, vendor_key=vendor_key(s["vendor"]), amount_p=-s["amount_p"])
+    s = s[s["vendor_key"] != ""].reset_index(drop=True)
+    # Labels as categoricals: the per-cluster first/last below then work on integer codes.
+    labels = [*GROUP, "vendor", "category"]
+    s[labels] = s[labels].astype("category")
+    s["vendor_count"] = s.groupby(GROUP, observed=True)["date"].transform("size")
+
+    s["exact"] = s.groupby([*GROUP, "amount_p"], sort=False, observed=True).ngroup()
+    e = _summarise(s, "exact")
+    series = _chain_exact(e, _qualifies(e, min_count, exact=True), band)
+    s["series"] = series.reindex(s["exact"]).to_numpy()
+    rest = s["series"].isna().to_numpy()
+    offset = int(s["exact"].max()) + 1
+    s.loc[rest, "series"] = offset + _amount_bands(s[rest], band)
+    out = _summarise(s, "series")
+    out = out[_qualifies(out, min_count, exact=out.index < offset)].copy()
+    if out.empty:
+        return pd.DataFrame(columns=SERIES_COLS)
+    out[labels] = out[labels].astype(object)
+
+    # Fixed-amount series (subscriptions, direct debits) change price rarely; for those the
+    # current amount is the commitment and any change is flagged. Variable ones use the median.
+    fixed = out["amount_changes"] <= 2
+    out["changed"] = fixed & (out["amount_changes"] > 0) & (out["last_amount_p"] != out["amount_p"])
+    out["amount_p"] = out["last_amount_p"].where(fixed, out["amount_p"])
+    out["next_date"] = out["last_date"]
+    out["monthly_p"] = 0.0
+    for name, (_, _, step, per_month) in PERIODS.items():
+        m = out["period"] == name
+        if m.any():
+            out.loc[m, "next_date"] = out.loc[m, "last_date"] + step
+            out.loc[m, "monthly_p"] = out.loc[m, "amount_p"] * per_month
+    out["amount_p"] = out["amount_p"].round().astype("int64")
+    out["last_amount_p"] = out["last_amount_p"].astype("int64")
+    out["monthly_p"] = out["monthly_p"].round().astype("int64")
+    out["interval_days"] = out["interval_days"].round(1)
+    out["regularity"] = out["regularity"].round(2)
+    out = flag_missed(out, as_of if as_of is not None else s["date"].max())
+    return out[SERIES_COLS].sort_values("monthly_p", ascending=False).reset_index(drop=True)
+
+def flag_missed(series: pd.DataFrame, as_of) -> pd.DataFrame:
+    """(Re)compute `missed` (whole periods overdue as of `as_of`) and `status` for detected series."""
+    out = series.copy()
+    if out.empty:
+        return out
+    days = out["period"].map({n: p[0] for n, p in PERIODS.items()}).astype(float)
+    tol = out["period"].map({n: p[1] for n, p in PERIODS.items()}).astype(float)
+    late = ((pd.Timestamp(as_of) - out["next_date"]).dt.days - tol).clip(lower=0)
+    out["missed"] = np.ceil(late / days).astype("int64")
+    out["status"] = np.select([out["missed"] > 0, out["changed"]], ["missed", "changed"], "active")
+    return out
+
+class RecurringDetector:
+    """
+    Incremental wrapper: keeps a compact history (account, vendor_key, vendor,
+    category, date, amount_p) and, on each `add()`, re-runs detection only for the vendors
+    touched by the new statement.
+    """
+
+    def __init__(self, band: float = 0.25, min_count: int = 3):
+        self.band = band
+        self.min_count = min_count
+        self.history = pd.DataFrame(columns=["account", "vendor_key", "vendor", "category", "date", "amount_p"])
+        self.series = pd.DataFrame(columns=SERIES_COLS)
+
+    def add(self, df: pd.DataFrame, as_of=None) -> pd.DataFrame:
+        new = coerce_spending(df)
+        new = new[new["amount_p"] < 0]
+        account = new["account"].fillna("Unknown").astype(str) if "account" in new.columns else "Unknown"
+        new = new.assign(account=account, vendor_key=vendor_key(new["vendor"]))[list(self.history.columns)]
+        self.history = new if self.history.empty else pd.concat([self.history, new], ignore_index=True)
+        touched = self.history["vendor_key"].isin(new["vendor_key"].unique())
+        as_of = as_of if as_of is not None else self.history["date"].max()
+        found = detect_recurring(self.history[touched], as_of=as_of, band=self.band, min_count=self.min_count)
+        keep = flag_missed(self.series[~self.series["vendor_key"].isin(new["vendor_key"])], as_of)
+        self.series = found if keep.empty else pd.concat([keep, found], ignore_index=True)
+        self.series = self.series.sort_values("monthly_p", ascending=False).reset_index(drop=True)
+        return self.series
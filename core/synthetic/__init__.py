@@ -0,0 +1 @@
+# synthetic (demo / load-test) data package
@@ -0,0 +1,231 @@
+"""
+Vectorised synthetic datasets for `sample_dataset = true` and load testing.
+
+Every generator takes a date span and a seed, builds whole columns with NumPy
+(no per-row Python loop) and returns a frame in the parsed CSV format the pages
+read: spending transactions, weekly Parasol payslips and daily Airbnb rows
+(one per listing). `write_dataset` writes straight to data/parsed.
+
+    python -m core.synthetic.generators --rows 10000000 --years 5 --listings 20
+"""
+from __future__ import annotations
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from core.classify.rules import load_categories, classify_vendor
+
+SPENDING_COLS = ["date", "vendor", "description", "amount", "currency", "account", "category"]
+PAYSLIP_COLS = [
+    "period_end", "gross", "paye", "ee_ni", "er_ni", "pension_ee", "pension_er",
+    "holiday_pay", "other_deductions", "student_loan", "net",
+]
+AIRBNB_COLS = [
+    "date", "listing", "nights", "currency", "statement_rate",
+    "income_eur", "cleaning_eur", "platform_fees_eur", "taxes_eur", "other_eur",
+]
+
+# category -> (share of card transactions, median £, lognormal sigma)
+CATEGORY_PROFILE = {
+    "Housing": (0.02, 45, 0.6), "Utilities": (0.05, 40, 0.5), "Groceries": (0.30, 35, 0.7),
+    "Transport": (0.18, 12, 0.8), "Insurance": (0.01, 30, 0.5), "Medical": (0.03, 15, 0.6),
+    "ChildrenMedical": (0.01, 40, 0.5), "School": (0.04, 20, 0.7), "Education": (0.03, 25, 0.7),
+    "Leisure": (0.08, 15, 0.7), "Misc": (0.25, 18, 0.9),
+}
+# Vendors no categories.yml keyword matches (they land in "Uncategorized" for the rule tuner).
+UNMATCHED_VENDORS = ["DELIVEROO", "JUST EAT", "PRET A MANGER", "CAFFE NERO", "ARGOS", "PAYPAL *MARKETPLACE", "IKEA"]
+VENDOR_SUFFIXES = ["", " LONDON", " ONLINE", " 0421", " UK LTD"]
+# (vendor, category, £ amount, months between payments, day of month); negative = outflow
+RECURRING = [
+    ("LANDLORD RENT", "Housing", -1250.00, 1, 1),
+    ("COUNCIL TAX LAMBETH", "Housing", -165.00, 1, 1),
+    ("OCTOPUS ENERGY", "Utilities", -92.00, 1, 5),
+    ("THAMES WATER", "Utilities", -118.00, 3, 12),
+    ("VODAFONE", "Utilities", -32.00, 1, 18),
+    ("NETFLIX.COM", "Leisure", -10.99, 1, 20),
+    ("SPOTIFY", "Leisure", -11.99, 1, 22),
+    ("AVIVA INSURANCE", "Insurance", -420.00, 12, 3),
+    ("PARASOL LTD SALARY", "Income", 3900.00, 1, 28),
+]
+
+def _load_categories() -> dict:
+    return load_categories(Path(__file__).resolve().parents[2] / "config" / "categories.yml")
+
+def _keyword_vendors(categories: dict | None) -> tuple[np.ndarray, np.ndarray]:
+    """Vendor pool built from categories.yml keywords so rules classify them; returns (vendors, category)."""
+    categories = categories if categories is not None else _load_categories()
+    vendors, cats = [], []
+    for cat, cfg in categories.items():
+        kws = (cfg or {}).get("include") or (UNMATCHED_VENDORS if cat == "Misc" else [])
+        for kw in kws:
+            base = f"JUNIOR{kw}SUBS" if kw != kw.strip() else kw  # keep padded keywords like " CLUB " matchable
+            for sfx in VENDOR_SUFFIXES:
+                vendors.append(base + sfx)
+                cats.append(cat)
+    return np.array(vendors, dtype=object), np.array(cats, dtype=object)
+
+def _days(start, end) -> tuple[np.datetime64, int]:
+    s = np.datetime64(pd.Timestamp(start).date(), "D")
+    e = np.datetime64(pd.Timestamp(end).date(), "D")
+    return s, int((e - s).astype(int)) + 1
+
+def default_span(years: float = 1.0) -> tuple[pd.Timestamp, pd.Timestamp]:
+    end = pd.Timestamp.today().normalize()
+    return end - pd.DateOffset(days=int(round(365.25 * years))), end
+
+def generate_spending(start, end, rows: int | None = None, accounts: int = 1, seed: int = 42,
+                      categories: dict | None = None) -> pd.DataFrame:
+    """
+    Card transactions plus regular direct debits/subscriptions for each account.
+    `rows` sets the number of card transactions (default ~5 per account per day).
+    """
+    rng = np.random.default_rng(seed)
+    d0, n_days = _days(start, end)
+    if n_days > np.iinfo(np.uint16).max:
+        raise ValueError("Spans longer than ~179 years are not supported.")
+    n = rows if rows is not None else 5 * n_days * accounts
+    vendors, vendor_cat = _keyword_vendors(categories)
+
+    cat_names = list(CATEGORY_PROFILE)
+    vendor_cat_idx = pd.Index(cat_names).get_indexer(vendor_cat)   # -1 = no profile
+    per_cat = np.bincount(vendor_cat_idx[vendor_cat_idx >= 0], minlength=len(cat_names))
+    share = np.array([CATEGORY_PROFILE[c][0] for c in cat_names]) * (per_cat > 0)
+    cat_idx = rng.choice(len(cat_names), size=n, p=share / share.sum())
+    # Pick a vendor uniformly within the chosen category: vendors grouped by category, offset + rank.
+    by_cat = np.argsort(np.where(vendor_cat_idx >= 0, vendor_cat_idx, len(cat_names)), kind="stable")
+    offset = np.concatenate([[0], np.cumsum(per_cat)[:-1]])
+    vidx = by_cat[offset[cat_idx] + (rng.random(n) * per_cat[cat_idx]).astype(np.int64)]
+
+    median = np.array([CATEGORY_PROFILE[c][1] for c in cat_names], dtype=float)[cat_idx]
+    sigma = np.array([CATEGORY_PROFILE[c][2] for c in cat_names], dtype=float)[cat_idx]
+    amount = -np.round(median * np.exp(sigma * rng.standard_normal(n)), 2)
+    day = rng.integers(0, n_days, size=n, dtype=np.uint16)  # 16-bit keys -> radix sort below
+    acct = rng.integers(0, accounts, size=n, dtype=np.int16)
+
+    # Recurring payments: one small block per item (no per-row loop).
+    rec = pd.concat([_recurring(d0, n_days, accounts, k) for k in range(len(RECURRING))], ignore_index=True)
+    day = np.concatenate([day, rec["day"].to_numpy(np.uint16)])
+    amount = np.concatenate([amount, rec["amount"].to_numpy()])
+    acct = np.concatenate([acct, rec["account"].to_numpy(np.int16)])
+    vendor_codes = np.concatenate([vidx, len(vendors) + rec["item"].to_numpy()])
+    order = np.argsort(day, kind="stable")
+
+    # Small vendor pool -> categoricals; category is what categories.yml rules would assign.
+    pool = np.concatenate([vendors, np.array([r[0] for r in RECURRING], dtype=object)])
+    pool_codes, uniq_vendors = pd.factorize(pool)  # a recurring payee may also be a keyword vendor
+    cats = categories if categories is not None else _load_categories()
+    pool_cat = [classify_vendor(v, cats, default="Uncategorized") for v in uniq_vendors]
+    cat_codes, cat_uniques = pd.factorize(np.array(pool_cat, dtype=object))
+    codes = pool_codes[vendor_codes[order]]
+    vendor_col = pd.Categorical.from_codes(codes, categories=uniq_vendors)
+    return pd.DataFrame({
+        "date": d0 + day[order].astype("timedelta64[D]"),
+        "vendor": vendor_col,
+        "description": vendor_col,
+        "amount": amount[order],
+        "currency": "GBP",
+        "account": pd.Categorical.from_codes(acct[order], categories=[f"ACCT-{i:03d}" for i in range(1, accounts + 1)]),
+        "category": pd.Categorical.from_codes(cat_codes[codes], categories=cat_uniques),
+    })[SPENDING_COLS]
+
+def _recurring(d0, n_days, accounts, k) -> pd.DataFrame:
+    _, _, amount, months, dom = RECURRING[k]
+    start = pd.Timestamp(d0)
+    end = start + pd.Timedelta(days=n_days - 1)
+    when = pd.period_range(start, end, freq="M")[::months].to_timestamp() + pd.Timedelta(days=dom - 1)
+    day = ((when[(when >= start) & (when <= end)] - start).days).to_numpy()
+    m = len(day)
+    return pd.DataFrame({
+        "day": np.tile(day, accounts),
+        "amount": np.full(m * accounts, amount),
+        "account": np.repeat(np.arange(accounts), m),
+        "item": np.full(m * accounts, k),
+    })
+
+def generate_payslips(start, end, seed: int = 17) -> pd.DataFrame:
+    """Weekly (Friday) Parasol-style payslips between start and end."""
+    g = np.random.default_rng(seed)
+    weeks = pd.date_range(pd.Timestamp(start), pd.Timestamp(end), freq="W-FRI")
+    n = len(weeks)
+    gross = np.round(np.maximum(900, g.normal(1200, 80, n)), 2)
+    paye, ee_ni, er_ni = (np.round(gross * r, 2) for r in (0.18, 0.09, 0.11))
+    pens_ee = pens_er = np.round(gross * 0.03, 2)
+    holiday = np.zeros(n)
+    other = np.round(np.maximum(0, g.normal(8, 6, n)), 2)
+    student = np.zeros(n)
+    net = np.round(gross - (paye + ee_ni + pens_ee + other + student) + holiday, 2)
+    return pd.DataFrame(dict(zip(PAYSLIP_COLS, [
+        weeks.date, gross, paye, ee_ni, er_ni, pens_ee, pens_er, holiday, other, student, net,
+    ])))
+
+def generate_airbnb(start, end, listings: int = 1, seed: int = 9) -> pd.DataFrame:
+    """Daily rows per listing with stochastic bookings; one EUR->GBP statement rate per month."""
+    g = np.random.default_rng(seed)
+    days = pd.date_range(pd.Timestamp(start), pd.Timestamp(end), freq="D")
+    n_days = len(days)
+    occ = g.uniform(0.35, 0.6, listings)          # per-listing occupancy
+    adr = g.normal(120, 25, listings).clip(60)    # per-listing average daily rate
+    booked = g.random((listings, n_days)) < occ[:, None]
+    income = np.where(booked, np.maximum(0, g.normal(adr[:, None], 15, (listings, n_days))), 0)
+    cleaning = np.where(booked & (g.random((listings, n_days)) < 0.6), 30.0, 0.0)
+    month = days.to_period("M")
+    month_codes, month_uniques = pd.factorize(month)
+    rate = np.round(g.normal(0.85, 0.02, len(month_uniques)), 4)[month_codes]
+    size = listings * n_days
+    return pd.DataFrame({
+        "date": np.tile(days.date, listings),
+        "listing": np.repeat([f"L{i + 1:03d}" for i in range(listings)], n_days),
+        "nights": booked.astype(np.int64).ravel(),
+        "currency": np.full(size, "EUR", dtype=object),
+        "statement_rate": np.tile(rate, listings),
+        "income_eur": np.round(income, 2).ravel(),
+        "cleaning_eur": cleaning.ravel(),
+        "platform_fees_eur": np.round(income * 0.14, 2).ravel(),
+        "taxes_eur": np.round(income * 0.03, 2).ravel(),
+        "other_eur": np.zeros(size),
+    })[AIRBNB_COLS]
+
+def write_dataset(df: pd.DataFrame, path: Path, journal=None) -> Path:
+    """
+    Write a parsed CSV (dates as YYYY-MM-DD). Uses pyarrow's multithreaded CSV
+    writer when installed (several times faster at load-test sizes), else pandas.
+    If an IngestJournal is given the dataset is registered so Home picks it up.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:
+        df.to_csv(path, index=False, date_format="%Y-%m-%d")
+    else:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        for i, field in enumerate(table.schema):
+            if pa.types.is_timestamp(field.type):
+                table = table.set_column(i, field.name, table.column(i).cast(pa.date32()))
+        pacsv.write_csv(table, path, pacsv.WriteOptions(quoting_style="needed"))
+    if journal is not None:
+        journal.record_dataset(path, df, source="synthetic")
+    return path
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Write synthetic spending/payslip/Airbnb CSVs to the parsed dataset folder.")
+    ap.add_argument("--out", type=Path, default=Path("data/parsed"))
+    ap.add_argument("--years", type=float, default=1.0)
+    ap.add_argument("--rows", type=int, default=None, help="card transactions (default ~5/day/account)")
+    ap.add_argument("--accounts", type=int, default=1)
+    ap.add_argument("--listings", type=int, default=1)
+    ap.add_argument("--seed", type=int, default=42)
+    a = ap.parse_args(argv)
+    start, end = default_span(a.years)
+    for name, df in [
+        ("synthetic_spending.csv", generate_spending(start, end, rows=a.rows, accounts=a.accounts, seed=a.seed)),
+        ("synthetic_parasol_income.csv", generate_payslips(start, end, seed=a.seed + 1)),
+        ("synthetic_airbnb.csv", generate_airbnb(start, end, listings=a.listings, seed=a.seed + 2)),
+    ]:
+        print(f"{write_dataset(df, a.out / name)}: {len(df):,} rows")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+import pandas as pd
+from core.dedup.transactions import TransactionDeduper, deduplicate, normalize_text
+
+def _frame(rows):
+    return pd.DataFrame(rows, columns=["date", "vendor", "amount", "account"])
+
+def test_merges_same_payment_across_sources():
+    pdf = _frame([["2024-01-01", "TESCO STORES 1234", -12.50, "A"], ["2024-01-05", "NETFLIX.COM", -9.99, "A"]])
+    csv = _frame([["2024-01-02", "Tesco Stores", -12.50, "A"], ["2024-01-20", "NETFLIX.COM", -9.99, "A"]])
+    out, report = deduplicate({"pdf": pdf, "csv": csv})
+    assert len(out) == 3
+    assert list(report["merged_source"]) == ["csv"]
+    assert report["kept_source"].iloc[0] == "pdf"
+
+def test_keeps_repeats_within_one_statement_and_other_accounts():
+    pdf = _frame([["2024-01-01", "COSTA", -3.20, "A"], ["2024-01-01", "COSTA", -3.20, "A"]])
+    other = _frame([["2024-01-01", "COSTA", -3.20, "B"]])
+    out, report = deduplicate({"pdf": pdf, "other": other})
+    assert len(out) == 3
+    assert report.empty
+
+def test_incremental_add_matches_against_earlier_batches():
+    dd = TransactionDeduper(window_days=3)
+    dd.add(_frame([["2024-03-01", "OCTOPUS ENERGY", -85.00, "A"]]), source="pdf")
+    kept = dd.add(_frame([["2024-03-03", "OCTOPUS ENERGY LTD", -85.00, "A"],
+                          ["2024-03-10", "OCTOPUS ENERGY", -85.00, "A"]]), source="ocr")
+    assert len(kept) == 1
+    assert len(dd.transactions()) == 2
+    assert len(dd.report) == 1
+
+def test_categorical_vendor_with_null():
+    df = _frame([["2024-01-01", "TESCO 12", -1.0, "A"], ["2024-01-02", None, -2.0, "A"]])
+    df["vendor"] = df["vendor"].astype("category")
+    assert list(normalize_text(df["vendor"])) == ["TESCO", ""]
+    assert len(TransactionDeduper().add(df, source="pdf")) == 2
@@ -0,0 +1,18 @@
+from core.perf.imports import HEAVY_MODULES, checked_modules, import_report, prewarm, probe_import
+
+def test_core_and_bootstrap_defer_heavy_imports():
+    # One fresh interpreter importing every core module and app._bootstrap at once.
+    modules = checked_modules()
+    assert "app._bootstrap" in modules
+    _, loaded = probe_import(", ".join(modules))
+    assert [m for m in HEAVY_MODULES if m in loaded] == []
+
+def test_import_report_rows():
+    rows = import_report(["core.classify.rules", "core.ingest.journal"])
+    assert {r["module"] for r in rows} == {"core.classify.rules", "core.ingest.journal"}
+    assert all(r["import_ms"] > 0 and r["heavy"] == [] for r in rows)
+
+def test_prewarm_skips_missing_modules():
+    t = prewarm(("json", "no_such_module_xyz"), charts=False)
+    t.join(timeout=30)
+    assert t.timings["json"] is not None and t.timings["no_such_module_xyz"] is None
@@ -0,0 +1,91 @@
+import os
+import pandas as pd
+from core.ingest.journal import IngestJournal
+
+def _setup(tmp_path):
+    raw, parsed = tmp_path / "raw", tmp_path / "parsed"
+    raw.mkdir(); parsed.mkdir()
+    return raw, parsed, IngestJournal(tmp_path / "journal.sqlite")
+
+def test_only_new_or_changed_files_are_queued(tmp_path):
+    raw, parsed, j = _setup(tmp_path)
+    (raw / "a.csv").write_text("date,vendor,amount\n2024-01-01,TESCO,-1.5\n")
+    (raw / "copy_of_a.csv").write_text("date,vendor,amount\n2024-01-01,TESCO,-1.5\n")
+    (raw / "statement.pdf").write_bytes(b"%PDF-1.4")
+    assert len(j.scan(raw)) == 2  # identical content queued once
+    results = {r["parser"]: r["status"] for r in j.process(parsed)}
+    assert results == {"csv_passthrough": "parsed", "bank_pdf": "unsupported"}
+    assert j.scan(raw) == [] and j.scan(raw, force=True) == []
+
+    (raw / "a.csv").write_text("date,vendor,amount\n2024-01-02,EDF,-80\n")
+    os.utime(raw / "a.csv", ns=(1, 1))
+    assert j.scan(raw, force=True) == [str(raw / "a.csv")]
+
+def test_overwrite_in_place_is_queued_and_supersedes_output(tmp_path):
+    raw, parsed, j = _setup(tmp_path)
+    (raw / "a.csv").write_text("date,vendor,amount\n2024-01-01,TESCO,-1.5\n")
+    j.scan(raw)
+    first = j.process(parsed)[0]["output"]
+    os.utime(raw, ns=(1, 1))  # the directory mtime is not trusted
+    (raw / "a.csv").write_text("date,vendor,amount\n2024-01-02,EDF,-80\n2024-01-03,EDF,-80\n")
+    os.utime(raw, ns=(1, 1))
+    assert j.scan(raw) == [str(raw / "a.csv")]
+    second = j.process(parsed)[0]["output"]
+    assert second != first and not os.path.exists(first)
+    assert sorted(os.listdir(parsed)) == [os.path.basename(second)]
+    assert j.stats()["datasets"] == 1 and j.latest_preview()[0] == second
+
+def test_output_shared_by_a_copy_is_kept(tmp_path):
+    raw, parsed, j = _setup(tmp_path)
+    (raw / "a.csv").write_text("date,vendor,amount\n2024-01-01,TESCO,-1.5\n")
+    j.scan(raw)
+    first = j.process(parsed)[0]["output"]
+    (raw / "b.csv").write_text("date,vendor,amount\n2024-01-01,TESCO,-1.5\n")
+    assert j.scan(raw) == []
+    (raw / "a.csv").write_text("date,vendor,amount\n2024-01-02,EDF,-80\n")
+    j.scan(raw)
+    j.process(parsed)
+    assert os.path.exists(first) and j.stats()["datasets"] == 2
+
+def test_parser_version_bump_requeues(tmp_path):
+    raw, parsed, j = _setup(tmp_path)
+    (raw / "s.pdf").write_bytes(b"%PDF")
+    j.scan(raw)
+    j.process(parsed)
+    j2 = IngestJournal(tmp_path / "journal.sqlite", parsers={".pdf": ("bank_pdf", "1", lambda p: pd.DataFrame({"x": [1]}))})
+    assert j2.pending() == [str(raw / "s.pdf")]
+    assert j2.process(parsed)[0]["status"] == "parsed"
+    assert j2.stats()["parsed"] == 1
+
+def test_preview_and_stats_come_from_journal(tmp_path):
+    raw, parsed, j = _setup(tmp_path)
+    pd.DataFrame({"a": range(50)}).to_csv(parsed / "old.csv", index=False)
+    assert j.sync_datasets(parsed) == 1
+    assert j.sync_datasets(parsed) == 0
+    pd.DataFrame({"a": range(7)}).to_csv(parsed / "old.csv", index=False)  # overwritten in place
+    assert j.sync_datasets(parsed) == 1
+    path, preview = j.latest_preview()
+    assert path.endswith("old.csv") and len(preview) == 7
+    demo = pd.DataFrame({"b": range(5)})
+    demo.to_csv(parsed / "demo.csv", index=False)
+    j.record_dataset(parsed / "demo.csv", demo, source="demo")
+    path, preview = j.latest_preview()
+    assert path.endswith("demo.csv") and list(preview["b"]) == list(range(5))
+    assert j.stats()["datasets"] == 2
+
+def test_listeners_see_recorded_and_removed_datasets(tmp_path):
+    raw, parsed, j = _setup(tmp_path)
+    events = []
+    j.add_listener(lambda path, df: events.append((os.path.basename(path), None if df is None else len(df))))
+    (raw / "a.csv").write_text("date,vendor,amount\n2024-01-01,TESCO,-1.5\n")
+    j.scan(raw)
+    first = os.path.basename(j.process(parsed)[0]["output"])
+    (raw / "a.csv").write_text("date,vendor,amount\n2024-01-02,EDF,-80\n2024-01-03,EDF,-80\n")
+    j.scan(raw)
+    second = os.path.basename(j.process(parsed)[0]["output"])
+    pd.DataFrame({"a": range(3)}).to_csv(parsed / "demo.csv", index=False)
+    j.sync_datasets(parsed)
+    os.remove(parsed / "demo.csv")
+    j.sync_datasets(parsed)
+    assert events == [(first, 1), (second, 2), (first, None), ("demo.csv", 3), ("demo.csv", None)]
+    assert j.datasets() == [str(parsed / second)]
@@ -0,0 +1,74 @@
+import pandas as pd
+import pytest
+from pydantic import TypeAdapter, ValidationError
+from core.models.columnar import check_frame, validate_frame, iter_records
+from core.models.finance import Transaction
+from core.models.property import PropertyPeriodSummary
+
+ROWS = [
+    {"date": "2024-01-01", "description": "Card", "vendor": "TESCO", "amount": -12.5},
+    {"date": "oops", "description": "Card", "vendor": None, "amount": "abc"},
+    {"date": "2024-01-03", "description": "DD", "vendor": "EDF", "amount": "-40", "account": "A"},
+    {"date": "2024-01", "description": "Card", "vendor": "TFL", "amount": -2.8},
+    {"date": "2024-02-30", "description": "Card", "vendor": "TFL", "amount": -2.8},
+    {"date": "2024-01-05T00:00:00", "description": "Card", "vendor": "TFL", "amount": -2.8},
+    {"date": "2024-01-05T10:30:00", "description": "Card", "vendor": "TFL", "amount": -2.8},
+]
+
+def test_errors_match_per_record_pydantic():
+    with pytest.raises(ValidationError) as per_row:
+        TypeAdapter(list[Transaction]).validate_python(ROWS)
+    _, errs = check_frame(pd.DataFrame(ROWS), Transaction)
+    assert errs == per_row.value.errors(include_url=False)
+
+def test_valid_rows_are_coerced_and_defaults_applied():
+    out, _ = check_frame(pd.DataFrame(ROWS), Transaction)
+    assert list(out.index) == [0, 2, 5]
+    assert out["amount"].dtype == "float64"
+    assert list(out["currency"]) == ["GBP"] * 3
+    assert out["account"].tolist() == [None, "A", None]
+    assert out.loc[5, "date"] == pd.Timestamp("2024-01-05")
+
+AMOUNTS = ["-40", "1_000", " 1.5 ", "nan", "inf", "1e3", ".5", True, 3, b"2.5", "0x10", "1,000", "", "£4"]
+
+def test_float_parsing_matches_pydantic():
+    rows = [{**ROWS[0], "amount": a} for a in AMOUNTS]
+    with pytest.raises(ValidationError) as per_row:
+        TypeAdapter(list[Transaction]).validate_python(rows)
+    out, errs = check_frame(pd.DataFrame(rows), Transaction)
+    assert errs == per_row.value.errors(include_url=False)
+    good = [Transaction(**r).amount for r in rows[:10]]
+    assert out["amount"].tolist()[:3] == good[:3] and out["amount"].tolist()[4:] == good[4:]
+    assert pd.isna(out.loc[3, "amount"])
+
+def test_missing_amount_is_an_error_even_as_nan():
+    # Stricter than pydantic (which accepts float('nan')): a blank amount cell is not a number.
+    df = pd.DataFrame([ROWS[0], {**ROWS[0], "amount": None}]).astype({"amount": "float64"})
+    out, errs = check_frame(df, Transaction)
+    assert [(e["type"], e["loc"], e["input"]) for e in errs] == [("float_type", (1, "amount"), None)]
+    assert list(out.index) == [0]
+
+def test_categorical_and_dictionary_columns():
+    pa = pytest.importorskip("pyarrow")
+    df = pd.DataFrame(ROWS[:1] * 3 + ROWS[2:3]).astype({"vendor": "category", "description": "category"})
+    out, errs = check_frame(df, Transaction)
+    assert errs == [] and len(out) == 4
+    batch = pa.RecordBatch.from_pandas(df.astype({"date": "datetime64[ns]", "amount": "float64"}), preserve_index=False)
+    assert pa.types.is_dictionary(batch.schema.field("vendor").type)
+    out, errs = check_frame(batch, Transaction)
+    assert errs == [] and out["vendor"].tolist() == ["TESCO"] * 3 + ["EDF"]
+    _, errs = check_frame(df.assign(vendor=pd.Categorical([1, 1, None, 1])), Transaction)
+    assert [(e["type"], e["loc"]) for e in errs] == [("string_type", (i, "vendor")) for i in range(4)]
+
+def test_validate_frame_raises_and_records_roundtrip():
+    with pytest.raises(ValidationError):
+        validate_frame(pd.DataFrame(ROWS), Transaction)
+    out = validate_frame(pd.DataFrame([ROWS[0]]), Transaction)
+    rec = next(iter_records(out, Transaction))
+    assert Transaction(**{f: getattr(rec, f) for f in Transaction.model_fields}).amount == -12.5
+    assert not hasattr(rec, "__dict__")
+
+def test_missing_required_column():
+    _, errs = check_frame(pd.DataFrame({"month": ["2024-01"]}), PropertyPeriodSummary)
+    assert {e["type"] for e in errs} == {"missing"}
+    assert len(errs) == 6
@@ -0,0 +1,32 @@
+import pandas as pd
+from core.convert.money import to_pence, to_display, format_gbp
+from core.convert.fx import eur_to_gbp_pence
+from core.income.calculators import rolling_12m_totals, weekly_to_monthly
+from core.property.calculators import monthly_summary
+from core.spending.calculators import category_totals
+
+def test_to_pence_rounds_half_to_even():
+    assert to_pence([0.125, 0.135, 1.015, -2.5, float("nan")]).tolist() == [12, 14, 102, -250, 0]
+    assert to_pence(pd.Series(["1.10", "x"])).tolist() == [110, 0]
+
+def test_fx_boundary_and_display():
+    p = eur_to_gbp_pence(pd.Series([100.0, 10.0]), pd.Series([0.8, 0]))
+    assert p.tolist() == [12500, 1000]
+    assert format_gbp(-123456) == "-£1,234.56"
+    assert to_display(pd.DataFrame({"net_gbp_p": [1050]}))["net_gbp"].tolist() == [10.5]
+
+def test_income_totals_are_exact_pence():
+    df = pd.DataFrame({"period_end": pd.date_range("2024-01-05", periods=52, freq="W-FRI"), "gross": 0.1, "net": 0.07})
+    tot = rolling_12m_totals(df)
+    assert tot["gross_p"] == 520 and tot["net_p"] == 364
+    assert weekly_to_monthly(df)["gross_p"].dtype == "int64"
+
+def test_property_and_spending_sums_in_pence():
+    air = pd.DataFrame({"date": ["2024-01-01", "2024-01-02"], "nights": 1, "statement_rate": 1.0,
+                        "income_eur": [100.005, 50.0], "platform_fees_eur": [14.0, 7.0]})
+    m = monthly_summary(air)
+    assert m["income_gbp_p"].tolist() == [15000]
+    assert m["net_gbp_p"].tolist() == [15000 - 2100]
+    sp = pd.DataFrame({"date": ["2024-01-01", "2024-02-01", "2024-02-03"], "amount": [-10.0, -5.55, 20.0], "category": "Groceries"})
+    tot = category_totals(sp, {"Groceries": "Section 3 – Food & housekeeping"})
+    assert tot.loc[0, "spend_p"] == 1555 and tot.loc[0, "monthly_avg_p"] == 778
@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+from core.spending.recurring import detect_recurring, vendor_key, RecurringDetector
+from core.synthetic.generators import RECURRING, generate_spending
+
+def _series(vendor, dates, amount, category="Misc"):
+    return pd.DataFrame({"date": dates, "vendor": vendor, "amount": amount, "category": category})
+
+def _history():
+    netflix = _series("NETFLIX.COM 866-579", pd.date_range("2023-01-15", periods=18, freq="MS") + pd.Timedelta(days=14), -10.99)
+    netflix.loc[netflix["date"] >= "2024-03-01", "amount"] = -12.99
+    water = _series("THAMES WATER", pd.date_range("2023-02-01", periods=4, freq="QS-FEB"), -120.0, "Utilities")
+    gym = _series("PUREGYM 0042", pd.date_range("2023-01-02", periods=30, freq="W-MON"), -9.0, "Leisure")
+    insurance = _series("AVIVA INSURANCE", ["2023-03-10", "2024-03-12"], -400.0, "Insurance")
+    oneoff = _series("IKEA", ["2023-05-01", "2023-05-20", "2023-09-03"], -250.0)
+    h = pd.concat([netflix, water, gym, insurance, oneoff], ignore_index=True)
+    h["date"] = pd.to_datetime(h["date"])
+    return h
+
+def test_detects_periods_and_monthly_equivalent():
+    r = detect_recurring(_history(), as_of="2024-07-20").set_index("vendor_key")
+    assert r.loc["NETFLIX COM", "period"] == "monthly"
+    assert r.loc["THAMES WATER", "period"] == "quarterly"
+    assert r.loc["PUREGYM", "period"] == "weekly"
+    assert r.loc["AVIVA INSURANCE", "period"] == "annual"
+    assert "IKEA" not in r.index
+    assert r.loc["THAMES WATER", "monthly_p"] == 4000
+    assert r.loc["AVIVA INSURANCE", "next_date"] == pd.Timestamp("2025-03-12")
+
+def test_flags_changed_and_missed():
+    r = detect_recurring(_history(), as_of="2024-07-20").set_index("vendor_key")
+    assert r.loc["NETFLIX COM", "status"] == "changed"
+    assert r.loc["NETFLIX COM", "amount_p"] == 1299
+    assert r.loc["THAMES WATER", "status"] == "missed"
+    assert r.loc["PUREGYM", "missed"] > 0
+    assert r.loc["AVIVA INSURANCE", "status"] == "active"
+
+def test_incremental_matches_batch():
+    h = _history()
+    det = RecurringDetector()
+    det.add(h[h["date"] < "2024-01-01"])
+    inc = det.add(h[h["date"] >= "2024-01-01"], as_of="2024-07-20")
+    full = detect_recurring(h, as_of="2024-07-20")
+    cols = ["vendor_key", "period", "amount_p", "status"]
+    key = lambda d: d[cols].sort_values("vendor_key").reset_index(drop=True)
+    pd.testing.assert_frame_equal(key(inc), key(full))
+
+def test_series_are_per_account_and_exact_amounts_first():
+    dd = pd.date_range("2023-01-05", periods=12, freq="MS") + pd.Timedelta(days=4)
+    h = pd.concat([
+        _series("VODAFONE", dd, -32.0, "Utilities").assign(account="A"),
+        _series("VODAFONE", dd + pd.Timedelta(days=15), -32.0, "Utilities").assign(account="B"),
+        # card spend at the same vendor, within the amount band of the direct debit
+        _series("VODAFONE", pd.date_range("2023-01-02", periods=12, freq="17D"), -36.5).assign(account="A"),
+        _series("COUNCIL TAX LAMBETH", dd, -165.0, "Housing").assign(account="A"),
+        _series("COUNCIL TAX ONLINE", pd.date_range("2023-02-20", periods=4, freq="90D"), -20.0).assign(account="A"),
+    ], ignore_index=True)
+    h["date"] = pd.to_datetime(h["date"])
+    r = detect_recurring(h, as_of="2024-01-10").set_index(["account", "vendor_key"])
+    assert r.loc[("A", "VODAFONE"), "amount_p"] == 3200 and r.loc[("B", "VODAFONE"), "period"] == "monthly"
+    assert r.loc[("A", "COUNCIL TAX LAMBETH"), "period"] == "monthly"
+    assert ("A", "COUNCIL TAX ONLINE") not in r.index or r.loc[("A", "COUNCIL TAX ONLINE"), "amount_p"] == 2000
+
+def test_two_card_payments_a_year_apart_are_not_annual():
+    g = np.random.default_rng(0)
+    days = np.sort(g.choice(730, size=80, replace=False))
+    shop = _series("LIDL ONLINE", pd.Timestamp("2023-01-01") + pd.to_timedelta(days, "D"), -np.round(g.lognormal(3, 0.7, 80), 2))
+    shop.loc[[10, 55], "amount"] = -400.68  # identical big basket, ~a year apart by coincidence
+    shop.loc[55, "date"] = shop.loc[10, "date"] + pd.Timedelta(days=366)
+    assert detect_recurring(shop).empty
+
+def test_every_generated_outflow_series_is_found_per_account():
+    s = generate_spending("2022-01-01", "2024-12-31", rows=20000, accounts=3, seed=3)
+    r = detect_recurring(s, as_of="2024-12-31")
+    found = {(a, v): p for a, v, p in r[["account", "vendor_key", "period"]].itertuples(index=False)}
+    periods = {1: "monthly", 3: "quarterly", 12: "annual"}
+    for vendor, _, amount, months, _ in RECURRING:
+        if amount >= 0:
+            continue
+        key = vendor_key(pd.Series([vendor]))[0]
+        for acct in ("ACCT-001", "ACCT-002", "ACCT-003"):
+            assert found.get((acct, key)) == periods[months], (acct, vendor)
@@ -0,0 +1,44 @@
+import pandas as pd
+from core.classify.rules import classify_vendor
+from core.spending.recurring import detect_recurring
+from core.synthetic.generators import (
+    AIRBNB_COLS, PAYSLIP_COLS, SPENDING_COLS, generate_airbnb, generate_payslips, generate_spending, write_dataset,
+)
+
+CATS = {
+    "Groceries": {"include": ["TESCO", "SAINSBURY"]},
+    "Transport": {"include": ["TFL"]},
+    "Utilities": {"include": ["OCTOPUS", "WATER"]},
+    "Misc": {"include": []},
+}
+
+def test_spending_is_reproducible_and_rule_labelled():
+    a = generate_spending("2024-01-01", "2024-06-30", rows=5000, accounts=2, seed=1, categories=CATS)
+    b = generate_spending("2024-01-01", "2024-06-30", rows=5000, accounts=2, seed=1, categories=CATS)
+    pd.testing.assert_frame_equal(a, b)
+    assert list(a.columns) == SPENDING_COLS
+    assert len(a) > 5000 and a["date"].is_monotonic_increasing
+    assert set(a["account"].unique()) == {"ACCT-001", "ACCT-002"}
+    for v, c in a[["vendor", "category"]].drop_duplicates().itertuples(index=False):
+        assert c == classify_vendor(v, CATS, default="Uncategorized")
+
+def test_categories_without_a_body():
+    cats = {"Groceries": {"include": ["TESCO"]}, "Misc": None, "Transport": {"include": None}}
+    s = generate_spending("2024-01-01", "2024-01-31", rows=200, seed=2, categories=cats)
+    assert set(s["category"].unique()) <= {"Groceries", "Uncategorized"}
+
+def test_spending_contains_recurring_series():
+    s = generate_spending("2023-01-01", "2023-12-31", rows=2000, seed=3, categories=CATS)
+    r = detect_recurring(s, as_of="2023-12-31").set_index("vendor_key")
+    assert r.loc["OCTOPUS ENERGY", "period"] == "monthly"
+    assert r.loc["THAMES WATER", "period"] == "quarterly"
+
+def test_payslips_and_airbnb_shapes(tmp_path):
+    p = generate_payslips("2024-01-01", "2024-12-31")
+    assert list(p.columns) == PAYSLIP_COLS and len(p) == 52
+    air = generate_airbnb("2024-01-01", "2024-01-31", listings=3)
+    assert list(air.columns) == AIRBNB_COLS and len(air) == 93
+    assert air.groupby("date")["statement_rate"].nunique().eq(1).all()
+    out = write_dataset(air, tmp_path / "air.csv")
+    back = pd.read_csv(out)
+    assert len(back) == 93 and back["date"].iloc[0] == "2024-01-01"
@@ -0,0 +1,47 @@
+import pandas as pd
+from core.classify.rules import classify_vendor, load_categories, save_categories
+from core.classify.vendor_index import VendorIndex
+
+CATS = {
+    "Groceries": {"include": ["TESCO", "CO-OP"]},
+    "Utilities": {"include": ["EE", "OCTOPUS"]},
+    "Misc": {"include": []},
+}
+
+def _index():
+    idx = VendorIndex()
+    idx.add(pd.DataFrame({
+        "vendor": ["Tesco Stores 123", "TESCO EXPRESS", "Tesco Stores 123", "Octopus Energy", "Deliveroo", "DELIVEROO PLUS", "Coffee House"],
+        "amount": [-10.0, -5.0, -2.5, -80.0, -20.0, -4.0, 3.0],
+    }))
+    return idx
+
+def test_lookup_counts_and_spend():
+    s = _index().summary("tesco")
+    assert s == {"vendors": 2, "count": 3, "spend_p": 1750}
+
+def test_short_keywords_and_classify_match_rules():
+    idx = _index()
+    assert idx.lookup("ee")["vendor"].tolist() == ["COFFEE HOUSE"]
+    cats = idx.classify(CATS)
+    assert list(cats) == [classify_vendor(v, CATS, default="Uncategorized") for v in idx.vendors]
+
+def test_incremental_add_and_suggestions():
+    idx = _index()
+    assert idx.add(pd.DataFrame({"vendor": ["DELIVEROO", "Just Eat"], "amount": [-6.0, -1.0]})) == 1
+    assert idx.summary("DELIVEROO")["count"] == 3
+    sugg = idx.suggest_keywords(CATS)
+    assert sugg.iloc[0]["keyword"] == "DELIVEROO"
+    assert sugg.iloc[0]["spend_p"] == 3000
+
+def test_empty_include_and_header_survive_save(tmp_path):
+    path = tmp_path / "categories.yml"
+    path.write_text("# Seeded categories\n# second line\ncategories:\n  Groceries:\n    include: [\"TESCO\"]\n  Misc:\n    include:\n")
+    cats = load_categories(path)
+    assert cats["Misc"]["include"] is None
+    assert classify_vendor("Deliveroo", cats) == "Misc"
+    assert list(_index().classify(cats)).count("Groceries") == 2
+    cats["Misc"] = {"include": ["DELIVEROO"]}
+    save_categories(path, cats)
+    assert path.read_text().startswith("# Seeded categories\n# second line\ncategories:")
+    assert load_categories(path)["Misc"] == {"include": ["DELIVEROO"]}